@@ -1,15 +1,18 @@
 """Agent nodes used for the multi-agents France Chomage app."""
 
-from .description_node import description_node
+from .description_node import description_node, stream_description_node
 from .filtering_node import filtering_node
 from .profiling_node import profiling_node
 from .ranking_node import ranking_node
 from .researcher_node import researcher_node
+from .scoring_node import scoring_node
 
 __all__ = [
     "profiling_node",
     "researcher_node",
     "filtering_node",
     "ranking_node",
+    "scoring_node",
     "description_node",
+    "stream_description_node",
 ]
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
 from typing import Any
 
 from graph import AgentState
 from pydantic import BaseModel, Field
-from utils import nebius_client
+from utils import JobMemo, build_user_payload, iter_batches, nebius_client
+
+_DESCRIPTION_MEMO = JobMemo("description")
+# Jobs left out of the ranking shortlist are not described, they keep this placeholder
+NOT_SHORTLISTED_DESCRIPTION = {
+    "summary": "Not scored: this job is less similar to your profile than the shortlisted ones.",
+    "positives": [],
+    "negatives": [],
+}
 
 
 class JobDescription(BaseModel):
@@ -54,19 +62,13 @@ def _llm_describe_jobs(
             "Be direct, no markdown or numbering, keep bullets brief and scannable."
         )
 
-        jobs_with_indices = [{**job, "index": idx} for idx, job in enumerate(jobs)]
-
-        user_payload = {
-            "profile": profile,
-            "preferences": preferences,
-            "jobs": jobs_with_indices,
-        }
+        user_payload = build_user_payload("description", profile, preferences, jobs)
 
         response = client.chat.completions.parse(
             model="openai/gpt-oss-120b",
             messages=[
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False, default=str)},
+                {"role": "user", "content": user_payload},
             ],
             response_format=DescriptionResult,
             temperature=0.25,
@@ -82,24 +84,21 @@ def _llm_describe_jobs(
         return None
 
 
-# Node -----------------
-def description_node(state: AgentState) -> dict[str, Any]:
-    """Attach concise candidate-focused descriptions to ranked jobs.
+def _described_state(
+    state: AgentState, jobs: list[dict[str, Any]], mapping: dict[int, JobDescription], finished: bool
+) -> dict[str, Any]:
+    """Build the agent state with the descriptions received so far attached to the ranked jobs.
 
     Args:
-        state (AgentState): Current agent state containing ranked jobs and candidate info.
+        state (AgentState): Current agent state.
+        jobs (list[dict[str, Any]]): Ranked jobs.
+        mapping (dict[int, JobDescription]): Descriptions received so far, by job index.
+        finished (bool): Whether every batch completed. Jobs still missing a description then get a placeholder,
+            otherwise they are left without `match_description`.
 
     Returns:
         dict[str, Any]: New agent state with job descriptions added.
     """
-    profile = state.get("profil_extracted") or {}
-    preferences = state.get("job_preferences") or {}
-    ranked = state.get("job_ranked") or {}
-    jobs: list[dict[str, Any]] = ranked.get("jobs") or []
-
-    llm_descriptions = _llm_describe_jobs(jobs, profile, preferences) or []
-    mapping: dict[int, JobDescription] = {item.index: item for item in llm_descriptions if 0 <= item.index < len(jobs)}
-
     described_jobs: list[dict[str, Any]] = []
     descriptions_payload: list[dict[str, Any]] = []
 
@@ -112,12 +111,17 @@ def description_node(state: AgentState) -> dict[str, Any]:
                 "positives": [p.strip() for p in item.positives if p.strip()],
                 "negatives": [n.strip() for n in item.negatives if n.strip()],
             }
-        else:
+        elif job.get("shortlisted") is False:
+            desc_payload = dict(NOT_SHORTLISTED_DESCRIPTION)
+        elif finished:
             desc_payload = {
                 "summary": "No description available.",
                 "positives": [],
                 "negatives": [],
             }
+        else:
+            described_jobs.append(job_copy)
+            continue
 
         job_copy["match_description"] = desc_payload
         described_jobs.append(job_copy)
@@ -129,4 +133,62 @@ def description_node(state: AgentState) -> dict[str, Any]:
     return new_state
 
 
-__all__ = ["description_node"]
+# Node -----------------
+def stream_description_node(state: AgentState) -> Iterator[dict[str, Any]]:
+    """Attach descriptions to ranked jobs, yielding a new state each time a batch of descriptions completes.
+
+    Jobs already described for the same profile and preferences in a previous run reuse their description, and jobs
+    left out of the ranking shortlist get a placeholder instead of a LLM description.
+
+    Args:
+        state (AgentState): Current agent state containing ranked jobs and candidate info.
+
+    Yields:
+        dict[str, Any]: Agent state with the descriptions received so far, the last one has every job described.
+    """
+    profile = state.get("profil_extracted") or {}
+    preferences = state.get("job_preferences") or {}
+    ranked = state.get("job_ranked") or {}
+    jobs: list[dict[str, Any]] = ranked.get("jobs") or []
+
+    def _describe_batch(batch: list[dict[str, Any]]) -> dict[int, JobDescription]:
+        llm_descriptions = _llm_describe_jobs(batch, profile, preferences) or []
+        return {item.index: item for item in llm_descriptions if 0 <= item.index < len(batch)}
+
+    memo_context = _DESCRIPTION_MEMO.context(profile, preferences)
+    shortlisted = [idx for idx, job in enumerate(jobs) if job.get("shortlisted") is not False]
+    memoized = _DESCRIPTION_MEMO.get_many(memo_context, [jobs[idx] for idx in shortlisted])
+    mapping: dict[int, JobDescription] = {
+        shortlisted[idx]: JobDescription(index=shortlisted[idx], **value) for idx, value in memoized.items()
+    }
+    unseen = [idx for idx in shortlisted if idx not in mapping]
+    if mapping and unseen:
+        yield _described_state(state, jobs, mapping, finished=False)
+
+    for offset, batch_mapping in iter_batches([jobs[idx] for idx in unseen], _describe_batch):
+        for idx, item in batch_mapping.items():
+            job_idx = unseen[offset + idx]
+            mapping[job_idx] = item
+            _DESCRIPTION_MEMO.set(memo_context, jobs[job_idx], item.model_dump(exclude={"index"}))
+        if len(mapping) < len(shortlisted):
+            yield _described_state(state, jobs, mapping, finished=False)
+
+    yield _described_state(state, jobs, mapping, finished=True)
+
+
+def description_node(state: AgentState) -> dict[str, Any]:
+    """Attach concise candidate-focused descriptions to ranked jobs, described in concurrent batches.
+
+    Args:
+        state (AgentState): Current agent state containing ranked jobs and candidate info.
+
+    Returns:
+        dict[str, Any]: New agent state with job descriptions added.
+    """
+    new_state: dict[str, Any] = dict(state)
+    for partial_state in stream_description_node(state):
+        new_state = partial_state
+    return new_state
+
+
+__all__ = ["description_node", "stream_description_node"]
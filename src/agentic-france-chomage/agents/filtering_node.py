@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import math
+import os
+import re
+from collections import Counter
 from typing import Any
 
+import pandas as pd
 from graph import AgentState
 from pydantic import BaseModel
-from utils import nebius_client
+from utils import build_user_payload, nebius_client, run_in_batches
 
 
 class FilteringResult(BaseModel):
@@ -16,7 +20,121 @@ class FilteringResult(BaseModel):
     keep_indices: list[int]
 
 
+# Most frequent function words of the languages found on French job boards, used to guess a posting's language
+LANGUAGE_STOPWORDS = {
+    "fr": {"le", "la", "les", "des", "et", "est", "une", "pour", "dans", "vous", "nous", "avec", "sur", "du", "au"},
+    "en": {"the", "and", "you", "with", "for", "are", "our", "will", "your", "this", "that", "have", "we", "is"},
+    "de": {"der", "die", "das", "und", "mit", "sie", "wir", "für", "ist", "ein", "eine", "bei", "auf", "zu"},
+    "es": {"el", "los", "las", "y", "con", "para", "una", "por", "que", "del", "nuestro", "en", "es", "como"},
+    "it": {"il", "di", "che", "per", "con", "una", "della", "nel", "sono", "gli", "alla", "delle", "come"},
+}
+LANGUAGE_NAMES = {
+    "fr": ("french", "français", "francais"),
+    "en": ("english", "anglais"),
+    "de": ("german", "allemand", "deutsch"),
+    "es": ("spanish", "espagnol", "español", "espanol"),
+    "it": ("italian", "italien", "italiano"),
+}
+# Language of the job market searched, always accepted since resumes often omit the candidate's native language
+MARKET_LANGUAGE = os.getenv("PREFILTER_MARKET_LANGUAGE", "fr")
+LANGUAGE_MIN_WORDS = 30  # shorter descriptions are not language filtered
+LANGUAGE_MIN_SHARE = 0.6  # share of the stopword hits needed to be confident about the language
+
+
 # Helpers -------------
+def _candidate_languages(profile: dict[str, Any]) -> set[str]:
+    """Map the languages listed in the profile to language codes.
+
+    Args:
+        profile (dict[str, Any]): Extracted candidate profile information.
+
+    Returns:
+        set[str]: Codes of the recognized candidate languages, empty if none is recognized.
+    """
+    codes: set[str] = set()
+    for language in profile.get("languages") or []:
+        text = str(language).lower()
+        words = set(re.findall(r"[^\W\d_]+", text))
+        codes.update(
+            code for code, names in LANGUAGE_NAMES.items() if words.intersection(names) or text.strip() == code
+        )
+    return codes
+
+
+def _detect_language(text: Any) -> str | None:  # noqa: ANN401
+    """Guess the language of a job description from its stopwords.
+
+    Args:
+        text (Any): Job description.
+
+    Returns:
+        str | None: Language code, or None if the text is missing, too short or ambiguous.
+    """
+    if not isinstance(text, str):
+        return None
+    words = re.findall(r"[^\W\d_]+", text.lower())
+    if len(words) < LANGUAGE_MIN_WORDS:
+        return None
+    counts = Counter(word for word in words if any(word in stopwords for stopwords in LANGUAGE_STOPWORDS.values()))
+    hits = {code: sum(counts[word] for word in stopwords) for code, stopwords in LANGUAGE_STOPWORDS.items()}
+    total = sum(hits.values())
+    code, best = max(hits.items(), key=lambda item: item[1])
+    return code if total and best / total >= LANGUAGE_MIN_SHARE else None
+
+
+def prefilter_jobs(
+    jobs: list[dict[str, Any]], profile: dict[str, Any], preferences: dict[str, Any]
+) -> tuple[list[int], dict[int, list[str]]]:
+    """Drop jobs that do not match the preferences using rules on the JobSpy columns, before any LLM call.
+
+    Rules: job type, posting age (from `date_posted`, day granularity), remote jobs only when `is_remote` is set, and
+    description language neither spoken by the candidate nor the MARKET_LANGUAGE. Missing values never drop a job.
+    The search radius is not checked, as JobSpy only returns location names.
+
+    Args:
+        jobs (list[dict[str, Any]]): List of job dicts to filter.
+        profile (dict[str, Any]): Extracted candidate profile information.
+        preferences (dict[str, Any]): Candidate job preferences.
+
+    Returns:
+        tuple[list[int], dict[int, list[str]]]: Indices of the jobs to keep and the reasons why each other job was
+            dropped.
+    """
+    if not jobs:
+        return [], {}
+    jobs_df = pd.DataFrame.from_records(jobs)
+    rules: dict[str, pd.Series] = {}
+
+    job_type = preferences.get("job_type")
+    if job_type and "job_type" in jobs_df.columns:
+        types = jobs_df["job_type"].astype("string").str.lower()
+        rules["job_type"] = types.notna() & ~types.str.contains(str(job_type).lower(), regex=False).fillna(True)
+
+    hours_old = preferences.get("hours_old")
+    if hours_old and "date_posted" in jobs_df.columns:
+        posted = pd.to_datetime(jobs_df["date_posted"], errors="coerce", utc=True).dt.normalize()
+        oldest = pd.Timestamp.now(tz="UTC").normalize() - pd.Timedelta(days=math.ceil(int(hours_old) / 24))
+        rules["too_old"] = posted.notna() & (posted < oldest)
+
+    if preferences.get("is_remote") and "is_remote" in jobs_df.columns:
+        rules["not_remote"] = jobs_df["is_remote"].map(lambda value: value is False or value == 0)
+
+    languages = _candidate_languages(profile)
+    if languages and "description" in jobs_df.columns:
+        detected = jobs_df["description"].map(_detect_language)
+        rules["language"] = detected.notna() & ~detected.isin(languages | {MARKET_LANGUAGE})
+
+    if not rules:
+        return list(range(len(jobs))), {}
+    dropped_mask = pd.DataFrame(rules).fillna(False).astype(bool)
+    keep = [int(i) for i in dropped_mask.index[~dropped_mask.any(axis=1)]]
+    reasons = {
+        int(i): [rule for rule, dropped in row.items() if dropped]
+        for i, row in dropped_mask[dropped_mask.any(axis=1)].iterrows()
+    }
+    return keep, reasons
+
+
 def _llm_filter_jobs(
     jobs: list[dict[str, Any]], profile: dict[str, Any], preferences: dict[str, Any]
 ) -> list[int] | None:
@@ -40,17 +158,12 @@ def _llm_filter_jobs(
             "Consider skills, experiences, location, and other preferences. "
             'Return JSON: {"keep_indices": [int, ...]} using the provided job indices.'
         )
-        jobs_with_indices = [{**job, "index": idx} for idx, job in enumerate(jobs)]
-        user_payload = {
-            "profile": profile,
-            "preferences": preferences,
-            "jobs": jobs_with_indices,
-        }
+        user_payload = build_user_payload("filtering", profile, preferences, jobs)
         response = client.chat.completions.parse(
             model="openai/gpt-oss-120b",
             messages=[
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False, default=str)},
+                {"role": "user", "content": user_payload},
             ],
             response_format=FilteringResult,
             temperature=0.15,
@@ -69,7 +182,7 @@ def _llm_filter_jobs(
 
 # Node -----------------
 def filtering_node(state: AgentState) -> dict[str, Any]:
-    """Filter job results using a LLM.
+    """Filter job results with deterministic rules, then a LLM on batches of the remaining jobs.
 
     Args:
         state (AgentState): Current agent state containing job search results and candidate info.
@@ -86,12 +199,26 @@ def filtering_node(state: AgentState) -> dict[str, Any]:
     else:
         jobs = job_results
 
-    keep_indices = _llm_filter_jobs(jobs, profile, preferences)
-    if keep_indices is not None:
-        filtered_jobs = [jobs[i] for i in keep_indices if 0 <= i < len(jobs)]
-    else:
-        filtered_jobs = jobs
+    prefilter_keep, prefilter_reasons = prefilter_jobs(jobs, profile, preferences)
+    candidates = [jobs[i] for i in prefilter_keep]
+    print(f"Pre-filter kept {len(candidates)} of {len(jobs)} jobs.")
+
+    def _filter_batch(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        keep_indices = _llm_filter_jobs(batch, profile, preferences)
+        return batch if keep_indices is None else [batch[i] for i in keep_indices]
+
+    filtered_jobs = [job for _, kept in run_in_batches(candidates, _filter_batch) for job in kept]
 
+    dropped_reasons = Counter(reason for reasons in prefilter_reasons.values() for reason in reasons)
+    dropped_reasons["llm"] = len(candidates) - len(filtered_jobs)
     new_state = dict(state)
-    new_state["job_filtered"] = {"jobs": filtered_jobs, "dropped": len(jobs) - len(filtered_jobs)}
+    new_state["job_filtered"] = {
+        "jobs": filtered_jobs,
+        "dropped": len(jobs) - len(filtered_jobs),
+        "dropped_reasons": dict(dropped_reasons),
+        "prefiltered": [
+            {"title": jobs[i].get("title"), "job_url": jobs[i].get("job_url"), "reasons": reasons}
+            for i, reasons in prefilter_reasons.items()
+        ],
+    }
     return new_state
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import os
 from typing import Any
 
+import numpy as np
 from graph import AgentState
 from pydantic import BaseModel
-from utils import nebius_client
+from utils import JobMemo, build_user_payload, job_similarities, nebius_client, run_in_batches
 
 NA_SCORE = -1
+PRERANK_TOP_K = int(os.getenv("PRERANK_TOP_K", "30"))  # jobs sent to the LLM ranker, 0 to send them all
+
+_SCORE_MEMO = JobMemo("ranking")
 
 
 class JobScore(BaseModel):
@@ -51,17 +55,12 @@ def _llm_rank_jobs(
             "Consider skills, experiences, seniority, location and other preferences. "
             'Return JSON: {"scores": [{"index": int, "score": int}, ...]} using the provided job indices.'
         )
-        jobs_with_indices = [{**job, "index": idx} for idx, job in enumerate(jobs)]
-        user_payload = {
-            "profile": profile,
-            "preferences": preferences,
-            "jobs": jobs_with_indices,
-        }
+        user_payload = build_user_payload("ranking", profile, preferences, jobs)
         response = client.chat.completions.parse(
             model="openai/gpt-oss-120b",
             messages=[
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False, default=str)},
+                {"role": "user", "content": user_payload},
             ],
             response_format=RankingResult,
             temperature=0.2,
@@ -89,9 +88,52 @@ def _llm_rank_jobs(
     return scored_jobs
 
 
+def rank_jobs(jobs: list[dict[str, Any]], profile: dict[str, Any], preferences: dict[str, Any]) -> list[dict[str, Any]]:
+    """Score the jobs closest to the profile with the LLM in concurrent batches, then sort and number them.
+
+    Only the PRERANK_TOP_K jobs most similar to the profile are sent to the LLM. The others are appended after the
+    scored ones, ordered by similarity, with an N/A score and 'shortlisted' set to False. Jobs already scored for the
+    same profile and preferences in a previous run reuse their score instead of going to the LLM. The profile
+    similarity of each job is stored under 'similarity' and breaks ties between equal or missing scores.
+
+    Args:
+        jobs (list[dict[str, Any]]): List of job dicts to rank.
+        profile (dict[str, Any]): Extracted candidate profile information.
+        preferences (dict[str, Any]): Candidate job preferences.
+
+    Returns:
+        list[dict[str, Any]]: Job dicts with 'score', 'similarity' and 'rank' fields, best first.
+    """
+    similarities = job_similarities(jobs, profile)
+    jobs = [
+        {**job, "similarity": round(float(similarity), 4)} for job, similarity in zip(jobs, similarities, strict=True)
+    ]
+    unranked_jobs: list[dict[str, Any]] = []
+    if 0 < PRERANK_TOP_K < len(jobs):
+        order = np.argsort(-similarities, kind="stable")
+        print(f"Pre-ranking shortlisted {PRERANK_TOP_K} of {len(jobs)} jobs.")
+        unranked_jobs = [{**jobs[i], "score": NA_SCORE, "shortlisted": False} for i in order[PRERANK_TOP_K:]]
+        jobs = [jobs[i] for i in sorted(order[:PRERANK_TOP_K])]
+
+    memo_context = _SCORE_MEMO.context(profile, preferences)
+    memoized = _SCORE_MEMO.get_many(memo_context, jobs)
+    scored_jobs = [{**job, "score": int(memoized[idx])} for idx, job in enumerate(jobs) if idx in memoized]
+    unseen_jobs = [job for idx, job in enumerate(jobs) if idx not in memoized]
+    for _, batch_scores in run_in_batches(unseen_jobs, lambda batch: _llm_rank_jobs(batch, profile, preferences)):
+        for job in batch_scores:
+            if job["score"] != NA_SCORE:
+                _SCORE_MEMO.set(memo_context, job, job["score"])
+            scored_jobs.append(job)
+    scored_jobs.sort(key=lambda job: (job.get("score", 0), job["similarity"]), reverse=True)
+    scored_jobs.extend(unranked_jobs)
+    for rank, job in enumerate(scored_jobs, start=1):
+        job["rank"] = rank
+    return scored_jobs
+
+
 # Node -----------------
 def ranking_node(state: AgentState) -> dict[str, Any]:
-    """Rank filtered jobs with Nebius LLM; mark missing scores as N/A.
+    """Rank filtered jobs with Nebius LLM, in concurrent batches; mark missing and non-shortlisted scores as N/A.
 
     Args:
         state (AgentState): Current agent state containing filtered job results and candidate info.
@@ -107,10 +149,7 @@ def ranking_node(state: AgentState) -> dict[str, Any]:
     else:
         jobs = job_source
 
-    scored_jobs = _llm_rank_jobs(jobs, profile, preferences)
-    scored_jobs.sort(key=lambda job: job.get("score", 0), reverse=True)
-    for rank, job in enumerate(scored_jobs, start=1):
-        job["rank"] = rank
+    scored_jobs = rank_jobs(jobs, profile, preferences)
 
     new_state = dict(state)
     new_state["job_ranked"] = {"jobs": scored_jobs}
@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
-import json
+import os
 from typing import Any
 
 from graph import AgentState
 from pydantic import BaseModel
-from utils import load_tool, nebius_client
+from utils import build_user_payload, load_tool, nebius_client, unpack_jobs
 
 job_search_tool = load_tool("job_search_tool")
 
+# Only the JobSpy columns used by the downstream nodes and the UI are transferred.
+JOB_FIELDS = [
+    "id",
+    "site",
+    "sites",
+    "source_urls",
+    "title",
+    "company",
+    "location",
+    "job_url",
+    "job_url_direct",
+    "date_posted",
+    "job_type",
+    "is_remote",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "interval",
+    "job_level",
+    "description",
+]
+JOB_DESCRIPTION_MAX_CHARS = int(os.getenv("JOB_DESCRIPTION_MAX_CHARS", "4000"))
+
 
 class SearchTerms(BaseModel):
     """Result structure for search terms."""
@@ -39,14 +62,14 @@ def _guess_search_terms(profile: dict[str, Any], preferences: dict[str, Any]) ->
         "Keep search_term under 6 words and avoid generic filler."
         "Return ONLY the JSON object, without any additional text."
     )
-    user_payload = {"profile": profile, "preferences": preferences}
+    user_payload = build_user_payload("search", profile, preferences)
 
     try:
         response = client.chat.completions.parse(
             model="openai/gpt-oss-20b",
             messages=[
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)},
+                {"role": "user", "content": user_payload},
             ],
             response_format=SearchTerms,
             temperature=0.2,
@@ -82,6 +105,7 @@ def researcher_node(state: AgentState) -> dict[str, Any]:
     results_wanted = int(preferences.get("results_wanted", 10))
     hours_old = int(preferences.get("hours_old", 72))
     linkedin_fetch_description = bool(preferences.get("linkedin_fetch_description", True))
+    parallel_sites = bool(preferences.get("parallel_sites", True))
 
     jobs = job_search_tool(
         site_name=site_name,
@@ -94,8 +118,13 @@ def researcher_node(state: AgentState) -> dict[str, Any]:
         results_wanted=results_wanted,
         hours_old=hours_old,
         linkedin_fetch_description=linkedin_fetch_description,
+        parallel_sites=parallel_sites,
+        fields=JOB_FIELDS,
+        max_description_chars=JOB_DESCRIPTION_MAX_CHARS or None,
+        response_format="columnar",
+        compress=True,
     )
 
     new_state = dict(state)
-    new_state["job_search_results"] = jobs
+    new_state["job_search_results"] = unpack_jobs(jobs)
     return new_state
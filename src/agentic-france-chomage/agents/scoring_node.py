@@ -0,0 +1,64 @@
+"""Agent node that scores jobs once to produce both job_filtered and job_ranked, replacing filtering and ranking."""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from typing import Any
+
+from graph import AgentState
+
+from .filtering_node import prefilter_jobs
+from .ranking_node import NA_SCORE, rank_jobs
+
+SCORING_MIN_SCORE = int(os.getenv("SCORING_MIN_SCORE", "5"))  # jobs scored below are filtered out
+
+
+# Node -----------------
+def scoring_node(state: AgentState) -> dict[str, Any]:
+    """Pre-filter jobs with deterministic rules, score the rest with a LLM and keep those above SCORING_MIN_SCORE.
+
+    Only the jobs shortlisted by `rank_jobs` are scored. Jobs the LLM did not score, or left out of the shortlist, are
+    kept and ranked last, like in the ranking node.
+
+    Args:
+        state (AgentState): Current agent state containing job search results and candidate info.
+
+    Returns:
+        dict[str, Any]: New agent state with filtered and ranked job results.
+    """
+    preferences = state.get("job_preferences") or {}
+    profile = state.get("profil_extracted") or {}
+    job_results = state.get("job_search_results") or []
+    jobs: list[dict[str, Any]]
+    if isinstance(job_results, dict):
+        jobs = job_results.get("jobs") or []
+    else:
+        jobs = job_results
+
+    prefilter_keep, prefilter_reasons = prefilter_jobs(jobs, profile, preferences)
+    candidates = [jobs[i] for i in prefilter_keep]
+    print(f"Pre-filter kept {len(candidates)} of {len(jobs)} jobs.")
+
+    scored_jobs = rank_jobs(candidates, profile, preferences)
+    kept_jobs = [job for job in scored_jobs if job["score"] == NA_SCORE or job["score"] >= SCORING_MIN_SCORE]
+    for rank, job in enumerate(kept_jobs, start=1):
+        job["rank"] = rank
+
+    dropped_reasons = Counter(reason for reasons in prefilter_reasons.values() for reason in reasons)
+    dropped_reasons["score"] = len(scored_jobs) - len(kept_jobs)
+    new_state = dict(state)
+    new_state["job_filtered"] = {
+        "jobs": [
+            {key: value for key, value in job.items() if key not in {"score", "rank", "similarity", "shortlisted"}}
+            for job in kept_jobs
+        ],
+        "dropped": len(jobs) - len(kept_jobs),
+        "dropped_reasons": dict(dropped_reasons),
+        "prefiltered": [
+            {"title": jobs[i].get("title"), "job_url": jobs[i].get("job_url"), "reasons": reasons}
+            for i, reasons in prefilter_reasons.items()
+        ],
+    }
+    new_state["job_ranked"] = {"jobs": kept_jobs}
+    return new_state
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import html
+import os
 from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Queue
 from typing import Any
 
 import gradio as gr
-from agents import description_node, filtering_node, profiling_node, ranking_node, researcher_node
+from agents import (
+    description_node,
+    filtering_node,
+    profiling_node,
+    ranking_node,
+    researcher_node,
+    scoring_node,
+    stream_description_node,
+)
 
 APP_CSS = """
 :root {
@@ -91,23 +100,41 @@ details[open] .summary-action::before {content: "–";}
 @keyframes fadeIn {from {opacity: 0; transform: translateY(4px);} to {opacity: 1; transform: translateY(0);}}
 """  # noqa: E501
 
-PROGRESS_STEPS = [
-    ("Profiling", "Understanding your resume"),
-    ("Researching", "Searching job boards"),
-    ("Filtering", "Discarding weak fits"),
-    ("Ranking", "Scoring the top options"),
-    ("Summarizing", "Writing the AI fit notes"),
-]
+# Filter and rank jobs in a single scoring pass instead of two LLM steps
+FUSED_SCORING = os.getenv("FUSED_SCORING", "false").lower() in {"1", "true", "yes"}
+
+if FUSED_SCORING:
+    PROGRESS_STEPS = [
+        ("Profiling", "Understanding your resume"),
+        ("Researching", "Searching job boards"),
+        ("Scoring", "Scoring and keeping the best fits"),
+        ("Summarizing", "Writing the AI fit notes"),
+    ]
+    PIPELINE_NODES = [
+        profiling_node,
+        researcher_node,
+        scoring_node,
+        description_node,
+    ]
+else:
+    PROGRESS_STEPS = [
+        ("Profiling", "Understanding your resume"),
+        ("Researching", "Searching job boards"),
+        ("Filtering", "Discarding weak fits"),
+        ("Ranking", "Scoring the top options"),
+        ("Summarizing", "Writing the AI fit notes"),
+    ]
+    PIPELINE_NODES = [
+        profiling_node,
+        researcher_node,
+        filtering_node,
+        ranking_node,
+        description_node,
+    ]
 
 _EXECUTOR = ThreadPoolExecutor(max_workers=1)
-
-PIPELINE_NODES = [
-    profiling_node,
-    researcher_node,
-    filtering_node,
-    ranking_node,
-    description_node,
-]
+# Nodes run as generators so their partial states are shown while they run
+STREAMING_NODES = {description_node: stream_description_node}
 
 
 def _first(keys: list[str], data: dict[str, Any], default: str = "") -> str:
@@ -253,7 +280,8 @@ def _execute_graph(
     Args:
         resume_path (str): Path to the resume file.
         preferences (dict[str, Any]): Job search preferences.
-        progress_queue (Queue | None): Queue to report step completion to the UI.
+        progress_queue (Queue | None): Queue to report step completion to the UI, as the index of the next step, and
+            ranked jobs as soon as they are available, as `("jobs", jobs)` tuples.
 
     Returns:
         tuple[str, str]: Summary text and HTML for ranked jobs.
@@ -261,9 +289,18 @@ def _execute_graph(
     state: dict[str, Any] = {"resume_file": resume_path, "job_preferences": preferences}
 
     for idx, node in enumerate(PIPELINE_NODES):
-        state = node(state)
+        if node in STREAMING_NODES:
+            partial_state = state
+            for partial_state in STREAMING_NODES[node](state):
+                if progress_queue:
+                    progress_queue.put(("jobs", partial_state.get("job_ranked", {}).get("jobs") or []))
+            state = partial_state
+        else:
+            state = node(state)
         if progress_queue and idx < len(PIPELINE_NODES) - 1:
             progress_queue.put(idx + 1)
+            if "job_ranked" in state:
+                progress_queue.put(("jobs", state["job_ranked"].get("jobs") or []))
 
     ranked_jobs = state.get("job_ranked", {}).get("jobs") or []
     summary = (
@@ -300,7 +337,12 @@ def _format_jobs_html(jobs: list[dict[str, Any]]) -> str:
         desc = job.get("match_description") or {}
         summary_text = (desc.get("summary") or "").strip()
         summary_text = html.escape(summary_text)
-        preview_text = _truncate(summary_text, limit=120) if summary_text else "Read AI fit summary"
+        if summary_text:
+            preview_text = _truncate(summary_text, limit=120)
+        elif "match_description" not in job:
+            preview_text = "Writing AI fit summary..."
+        else:
+            preview_text = "Read AI fit summary"
         positives = [html.escape(p.strip()) for p in (desc.get("positives") or []) if p.strip()]
         negatives = [html.escape(n.strip()) for n in (desc.get("negatives") or []) if n.strip()]
 
@@ -439,7 +481,8 @@ def run_pipeline(
     future = _EXECUTOR.submit(_execute_graph, resume_path, preferences, progress_queue)
     active_idx = 0
     status_text = f"{PROGRESS_STEPS[active_idx][0]} in progress..."
-    yield _render_progress(active_idx, status_text), _loading_jobs_html()
+    jobs_html = _loading_jobs_html()
+    yield _render_progress(active_idx, status_text), jobs_html
 
     while True:
         try:
@@ -447,10 +490,13 @@ def run_pipeline(
         except Empty:
             next_idx = None
 
-        if isinstance(next_idx, int) and next_idx != active_idx and 0 <= next_idx < len(PROGRESS_STEPS):
+        if isinstance(next_idx, tuple) and next_idx[0] == "jobs":
+            jobs_html = _format_jobs_html(next_idx[1])
+            yield _render_progress(active_idx, status_text), jobs_html
+        elif isinstance(next_idx, int) and next_idx != active_idx and 0 <= next_idx < len(PROGRESS_STEPS):
             active_idx = next_idx
             status_text = f"{PROGRESS_STEPS[active_idx][0]} in progress..."
-            yield _render_progress(active_idx, status_text), _loading_jobs_html()
+            yield _render_progress(active_idx, status_text), jobs_html
 
         if future.done() and progress_queue.empty():
             break
@@ -473,8 +519,8 @@ with gr.Blocks(title="France Chômage — Agentic matcher", fill_width=True) as
         """
         # France Chômage — Agentic matcher
         Upload your resume and basic preferences to let our multi-agent graph extract your profile, search job boards,
-        filter irrelevant offers, and rank the best matches. Sometimes, MCP tools call to Blaxel fail. Please retry if
-        it happens.
+        filter irrelevant offers, and rank the best matches. Failed MCP tool calls to Blaxel are retried automatically.
+        If the search still fails, please retry.
         Make sure `NEBIUS_API_KEY` is set in your environment (FREE ACCESS until 2025-12-16).
         """
     )
@@ -5,15 +5,18 @@ from typing import Any
 from .state import AgentState
 
 
-def build_graph() -> Any:  # noqa: ANN401
+def build_graph(fused_scoring: bool = False) -> Any:  # noqa: ANN401
     """Lazily import and build the workflow graph to avoid circular imports.
 
+    Args:
+        fused_scoring (bool): Whether to filter and rank jobs in a single scoring pass.
+
     Returns:
         Any: Compiled StateGraph instance.
     """
     from .graph import build_graph as _build_graph
 
-    return _build_graph()
+    return _build_graph(fused_scoring=fused_scoring)
 
 
 __all__ = ["build_graph", "AgentState"]
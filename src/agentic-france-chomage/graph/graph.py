@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from typing import Any
 
-from agents import description_node, filtering_node, profiling_node, ranking_node, researcher_node
+from agents import description_node, filtering_node, profiling_node, ranking_node, researcher_node, scoring_node
 from langgraph.graph import END, StateGraph
 
 from graph.state import AgentState
 
 
-def build_graph() -> Any:  # noqa: ANN401
+def build_graph(fused_scoring: bool = False) -> Any:  # noqa: ANN401
     """Construct the job-search pipeline graph.
 
-    Profiling -> Researcher -> Filtering -> Ranking
+    Profiling -> Researcher -> Filtering -> Ranking -> Description, or
+    Profiling -> Researcher -> Scoring -> Description with fused scoring.
+
+    Args:
+        fused_scoring (bool): Whether to filter and rank jobs in a single scoring pass.
 
     Returns:
         Any: Compiled StateGraph instance.
@@ -22,15 +26,20 @@ def build_graph() -> Any:  # noqa: ANN401
 
     workflow.add_node("profiling", profiling_node)
     workflow.add_node("researcher", researcher_node)
-    workflow.add_node("filtering", filtering_node)
-    workflow.add_node("ranking", ranking_node)
     workflow.add_node("description", description_node)
 
     workflow.set_entry_point("profiling")
     workflow.add_edge("profiling", "researcher")
-    workflow.add_edge("researcher", "filtering")
-    workflow.add_edge("filtering", "ranking")
-    workflow.add_edge("ranking", "description")
+    if fused_scoring:
+        workflow.add_node("scoring", scoring_node)
+        workflow.add_edge("researcher", "scoring")
+        workflow.add_edge("scoring", "description")
+    else:
+        workflow.add_node("filtering", filtering_node)
+        workflow.add_node("ranking", ranking_node)
+        workflow.add_edge("researcher", "filtering")
+        workflow.add_edge("filtering", "ranking")
+        workflow.add_edge("ranking", "description")
     workflow.add_edge("description", END)
 
     return workflow.compile()
@@ -1,6 +1,20 @@
 """Utilities for the agentic-france-chomage package."""
 
+from .batching import iter_batches, run_in_batches
+from .embeddings import job_similarities
+from .memo import JobMemo
+from .payloads import unpack_jobs
+from .prompting import build_user_payload
 from .providers import nebius_client
 from .tool_loader import load_tool
 
-__all__ = ["nebius_client", "load_tool"]
+__all__ = [
+    "JobMemo",
+    "build_user_payload",
+    "nebius_client",
+    "load_tool",
+    "iter_batches",
+    "job_similarities",
+    "run_in_batches",
+    "unpack_jobs",
+]
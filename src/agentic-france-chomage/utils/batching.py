@@ -0,0 +1,81 @@
+"""Helpers to split LLM work on job lists into batches processed concurrently."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "10"))  # jobs per LLM call
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # LLM calls in flight, shared by all pipelines
+
+_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=max(1, LLM_MAX_CONCURRENCY), thread_name_prefix="llm-batch")
+
+
+def run_in_batches(
+    items: Sequence[T], fn: Callable[[list[T]], R], batch_size: int | None = None
+) -> list[tuple[int, R]]:
+    """Split items into batches and run fn on each batch, at most LLM_MAX_CONCURRENCY at a time.
+
+    Results are returned in batch order with the offset of each batch in items, so indices local to a batch can be
+    mapped back with `offset + index`. A single batch runs in the calling thread.
+
+    Args:
+        items (Sequence[T]): Items to process.
+        fn (Callable[[list[T]], R]): Function processing one batch.
+        batch_size (int | None): Maximum number of items per batch, defaults to LLM_BATCH_SIZE.
+
+    Returns:
+        list[tuple[int, R]]: (offset, result) of each batch.
+
+    Raises:
+        Exception: The first error raised by fn, once every batch has completed.
+    """
+    size = max(1, batch_size or LLM_BATCH_SIZE)
+    batches = [(offset, list(items[offset : offset + size])) for offset in range(0, len(items), size)]
+    if len(batches) <= 1:
+        return [(offset, fn(batch)) for offset, batch in batches]
+
+    futures = [(offset, _BATCH_EXECUTOR.submit(fn, batch)) for offset, batch in batches]
+    results: list[tuple[int, R]] = []
+    error: Exception | None = None
+    for offset, future in futures:
+        try:
+            results.append((offset, future.result()))
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+    return results
+
+
+def iter_batches(
+    items: Sequence[T], fn: Callable[[list[T]], R], batch_size: int | None = None
+) -> Iterator[tuple[int, R]]:
+    """Like `run_in_batches`, but yield each (offset, result) as soon as its batch completes.
+
+    Args:
+        items (Sequence[T]): Items to process.
+        fn (Callable[[list[T]], R]): Function processing one batch.
+        batch_size (int | None): Maximum number of items per batch, defaults to LLM_BATCH_SIZE.
+
+    Yields:
+        tuple[int, R]: (offset, result) of each batch, in completion order.
+
+    Raises:
+        Exception: The error raised by fn for a batch, when that batch completes.
+    """
+    size = max(1, batch_size or LLM_BATCH_SIZE)
+    futures = {
+        _BATCH_EXECUTOR.submit(fn, list(items[offset : offset + size])): offset for offset in range(0, len(items), size)
+    }
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,165 @@
+"""Persistent on-disk cache shared by the agent nodes."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(os.getenv("AGENT_CACHE_DIR", str(Path.home() / ".cache" / "france-chomage-app")))
+
+
+class SQLiteCache:
+    """A key-value cache stored in a SQLite file with TTL expiry and LRU eviction.
+
+    Values are stored as JSON. Cache failures are reported and treated as misses so a broken cache never breaks a node.
+
+    Args:
+        name (str): Name of the cache, used as the SQLite file name.
+        ttl (float | None): Time to live of an entry in seconds, None to never expire.
+        max_entries (int | None): Maximum number of entries kept, least recently used entries are evicted first.
+        max_bytes (int | None): Maximum total size of the stored values in bytes, evicted in LRU order.
+        cache_dir (Path | None): Directory of the SQLite file, defaults to `AGENT_CACHE_DIR`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = (cache_dir or CACHE_DIR) / f"{name}.sqlite3"
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache file, creating the schema on first use.
+
+        Returns:
+            sqlite3.Connection: A new connection, to be closed by the caller.
+        """
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+            conn.commit()
+            self._ready = True
+        return conn
+
+    def _count(self, hit: bool) -> None:
+        """Update the hit/miss counters.
+
+        Args:
+            hit (bool): Whether the lookup was a hit.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Return the cached value for key, or None on a miss or an expired entry.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any | None: The cached value, or None if not found.
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT value, created FROM cache WHERE key = ?", (key,)).fetchone()
+                if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    conn.commit()
+                    row = None
+                if row is None:
+                    self._count(hit=False)
+                    return None
+                conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+            value = json.loads(row[0])
+        except (sqlite3.Error, OSError, json.JSONDecodeError) as e:
+            print(f"Cache '{self.name}' read failed: {e}")
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a JSON-serializable value under key, then evict expired and least recently used entries.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to store, non JSON types are stored as strings.
+        """
+        now = time.time()
+        try:
+            payload = json.dumps(value, ensure_ascii=False, default=str)
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload.encode("utf-8")), now, now),
+                )
+                self._evict(conn, now)
+                conn.commit()
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            print(f"Cache '{self.name}' write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Remove expired entries, then least recently used entries above the size bounds.
+
+        Args:
+            conn (sqlite3.Connection): Open connection to the cache file.
+            now (float): Current timestamp.
+        """
+        if self.ttl is not None:
+            conn.execute("DELETE FROM cache WHERE created < ?", (now - self.ttl,))
+        if self.max_entries is not None:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC) AS total FROM cache) "
+                "WHERE total > ?)",
+                (self.max_bytes,),
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the current size of the cache.
+
+        Returns:
+            dict[str, Any]: Cache statistics.
+        """
+        entries, size = 0, 0
+        try:
+            with closing(self._connect()) as conn:
+                entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Cache '{self.name}' stats failed: {e}")
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": entries, "size_bytes": size}
@@ -0,0 +1,139 @@
+"""CPU-only similarity between a candidate profile and jobs, used to shortlist jobs before the LLM ranker."""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+from importlib.util import find_spec
+from typing import Any
+
+import numpy as np
+
+# "auto" uses sentence-transformers when installed, "tfidf" always uses the TF-IDF fallback
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "auto").lower()
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+EMBEDDING_MAX_CHARS = 2000  # per text, longer job descriptions are cut
+
+_MODEL_LOCK = threading.Lock()
+_MODEL: Any | None = None
+_MODEL_FAILED = False
+
+
+def _sentence_model() -> Any | None:  # noqa: ANN401
+    """Load the sentence-transformers model once, or return None to use the TF-IDF fallback.
+
+    Returns:
+        Any | None: SentenceTransformer instance, or None if disabled, not installed or not loadable.
+    """
+    global _MODEL, _MODEL_FAILED  # noqa: PLW0603
+    if EMBEDDING_BACKEND == "tfidf" or _MODEL_FAILED:
+        return None
+    if _MODEL is None:
+        with _MODEL_LOCK:
+            if _MODEL is None and not _MODEL_FAILED:
+                if find_spec("sentence_transformers") is None:
+                    print("sentence-transformers is not installed, using TF-IDF similarity.")
+                    _MODEL_FAILED = True
+                    return None
+                try:
+                    from sentence_transformers import SentenceTransformer
+
+                    _MODEL = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+                except Exception as e:
+                    print(f"Could not load embedding model '{EMBEDDING_MODEL}', using TF-IDF similarity: {e}")
+                    _MODEL_FAILED = True
+                    return None
+    return _MODEL
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase, strip accents and split a text into word tokens.
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        list[str]: Tokens of at least 2 characters.
+    """
+    folded = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    return [token for token in re.findall(r"[a-z0-9+#]+", folded) if len(token) > 1]
+
+
+def _tfidf_vectors(texts: list[str]) -> np.ndarray:
+    """Build L2-normalized TF-IDF vectors with sublinear term frequencies.
+
+    Args:
+        texts (list[str]): Texts to vectorize.
+
+    Returns:
+        np.ndarray: Matrix of shape (len(texts), vocabulary size).
+    """
+    counts = [Counter(_tokenize(text)) for text in texts]
+    vocabulary = {token: idx for idx, token in enumerate(sorted(set().union(*counts)))}
+    vectors = np.zeros((len(texts), max(1, len(vocabulary))), dtype=np.float32)
+    for row, count in enumerate(counts):
+        for token, freq in count.items():
+            vectors[row, vocabulary[token]] = 1.0 + math.log(freq)
+    document_freq = np.count_nonzero(vectors, axis=0)
+    vectors *= np.log((1 + len(texts)) / (1 + document_freq)) + 1.0
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def profile_text(profile: dict[str, Any]) -> str:
+    """Flatten the skills and experiences of a profile into one text.
+
+    Args:
+        profile (dict[str, Any]): Extracted candidate profile information.
+
+    Returns:
+        str: The profile text.
+    """
+    parts: list[str] = []
+    for key in ("hard_skills", "soft_skills", "projects"):
+        parts.extend(str(item) for item in profile.get(key) or [])
+    for item in profile.get("experiences") or []:
+        if isinstance(item, dict):
+            parts.extend(str(item.get(key) or "") for key in ("role", "organization", "description"))
+        else:
+            parts.append(str(item))
+    return " ".join(parts)[: EMBEDDING_MAX_CHARS * 2]
+
+
+def job_text(job: dict[str, Any]) -> str:
+    """Join the title and the beginning of the description of a job.
+
+    Args:
+        job (dict[str, Any]): Job dict as returned by JobSpy.
+
+    Returns:
+        str: The job text.
+    """
+    parts = [job.get(key) for key in ("title", "job_level", "description")]
+    return " ".join(part for part in parts if isinstance(part, str))[:EMBEDDING_MAX_CHARS]
+
+
+def job_similarities(jobs: list[dict[str, Any]], profile: dict[str, Any]) -> np.ndarray:
+    """Compute the cosine similarity between a profile and every job, in one batch.
+
+    Args:
+        jobs (list[dict[str, Any]]): Jobs to compare.
+        profile (dict[str, Any]): Extracted candidate profile information.
+
+    Returns:
+        np.ndarray: One similarity per job, higher is closer.
+    """
+    if not jobs:
+        return np.zeros(0, dtype=np.float32)
+    texts = [profile_text(profile), *(job_text(job) for job in jobs)]
+    model = _sentence_model()
+    if model is not None:
+        vectors = np.asarray(model.encode(texts, batch_size=32, normalize_embeddings=True), dtype=np.float32)
+    else:
+        vectors = _tfidf_vectors(texts)
+    return vectors[1:] @ vectors[0]
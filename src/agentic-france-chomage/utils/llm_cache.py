@@ -0,0 +1,184 @@
+"""Persistent cache of LLM chat completions, wrapped around the `chat.completions.parse` path of the client."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from types import SimpleNamespace
+from typing import Any
+
+from pydantic import BaseModel
+
+from .cache import SQLiteCache
+
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))  # in seconds, 0 disables the cache
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+
+_LLM_CACHE = (
+    SQLiteCache("llm_responses", ttl=LLM_CACHE_TTL, max_entries=LLM_CACHE_MAX_ENTRIES, max_bytes=LLM_CACHE_MAX_BYTES)
+    if LLM_CACHE_TTL > 0
+    else None
+)
+
+
+def _canonical_content(content: Any) -> Any:  # noqa: ANN401
+    """Canonicalize a message content so that formatting differences do not change the cache key.
+
+    JSON contents are re-encoded with sorted keys, other texts have their whitespace collapsed.
+
+    Args:
+        content (Any): Message content.
+
+    Returns:
+        Any: The canonical content.
+    """
+    if not isinstance(content, str):
+        return content
+    try:
+        return json.dumps(json.loads(content), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    except ValueError:
+        return " ".join(content.split())
+
+
+def completion_cache_key(
+    model: str,
+    messages: list[dict[str, Any]],
+    temperature: float | None,
+    response_format: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> str:
+    """Build the cache key of a chat completion request.
+
+    Args:
+        model (str): Model name.
+        messages (list[dict[str, Any]]): Chat messages.
+        temperature (float | None): Sampling temperature.
+        response_format (Any): Pydantic model or response format of the request.
+        **kwargs (Any): Other request parameters, such as max_tokens.
+
+    Returns:
+        str: SHA-256 hex digest of the canonical request.
+    """
+    messages_hash = hashlib.sha256(
+        json.dumps(
+            [{**message, "content": _canonical_content(message.get("content"))} for message in messages],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        response_format = response_format.model_json_schema()
+    canonical = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "messages": messages_hash,
+            "response_format": response_format,
+            "params": kwargs,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CachedCompletions:
+    """Proxy of `client.chat.completions` serving `parse` calls from the persistent LLM cache.
+
+    A cache hit returns an object exposing `choices[0].message.parsed` and `choices[0].message.content`, the only
+    response attributes used by the agent nodes.
+
+    Args:
+        completions (Any): The `chat.completions` resource of an OpenAI client.
+        model_timeouts (dict[str, float] | None): Default timeout in seconds per model, for calls without a timeout.
+    """
+
+    def __init__(self, completions: Any, model_timeouts: dict[str, float] | None = None) -> None:  # noqa: ANN401
+        self._completions = completions
+        self._model_timeouts = model_timeouts or {}
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Delegate everything but `parse` to the wrapped resource.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: The attribute of the wrapped resource.
+        """
+        return getattr(self._completions, name)
+
+    def parse(self, *, cache: bool = True, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Call `chat.completions.parse`, through the cache unless disabled.
+
+        Args:
+            cache (bool): Whether to read and write the cache for this call.
+            **kwargs (Any): Arguments of `chat.completions.parse`.
+
+        Returns:
+            Any: The completion, or its cached equivalent.
+        """
+        model_timeout = self._model_timeouts.get(kwargs.get("model", ""))
+        if model_timeout is not None:
+            kwargs.setdefault("timeout", model_timeout)
+        if _LLM_CACHE is None or not cache:
+            return self._completions.parse(**kwargs)
+
+        request = {key: value for key, value in kwargs.items() if key not in {"timeout", "extra_headers"}}
+        key = completion_cache_key(
+            request.pop("model", None),
+            request.pop("messages", []),
+            request.pop("temperature", None),
+            request.pop("response_format", None),
+            **request,
+        )
+        response_format = kwargs.get("response_format")
+        cached = _LLM_CACHE.get(key)
+        if cached is not None:
+            parsed = cached.get("parsed")
+            if parsed is not None and isinstance(response_format, type) and issubclass(response_format, BaseModel):
+                parsed = response_format.model_validate(parsed)
+            message = SimpleNamespace(content=cached.get("content"), parsed=parsed, refusal=None)
+            print(f"LLM cache hit for {kwargs.get('model')} ({key[:12]}).")
+            return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")], usage=None)
+
+        response = self._completions.parse(**kwargs)
+        choice = response.choices[0]
+        parsed = getattr(choice.message, "parsed", None)
+        # Only complete, usable answers are cached
+        if getattr(choice, "finish_reason", "stop") == "stop" and (parsed is not None or choice.message.content):
+            _LLM_CACHE.set(
+                key,
+                {
+                    "content": choice.message.content,
+                    "parsed": parsed.model_dump() if isinstance(parsed, BaseModel) else parsed,
+                },
+            )
+        return response
+
+
+class CachedClient:
+    """Proxy of an OpenAI client whose `chat.completions.parse` calls go through the persistent LLM cache.
+
+    Args:
+        client (Any): OpenAI-compatible client.
+        model_timeouts (dict[str, float] | None): Default timeout in seconds per model, for calls without a timeout.
+    """
+
+    def __init__(self, client: Any, model_timeouts: dict[str, float] | None = None) -> None:  # noqa: ANN401
+        self._client = client
+        self.chat = SimpleNamespace(completions=CachedCompletions(client.chat.completions, model_timeouts))
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Delegate everything but `chat` to the wrapped client.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: The attribute of the wrapped client.
+        """
+        return getattr(self._client, name)
@@ -0,0 +1,95 @@
+"""Per-job memoization of LLM results across runs, so only unseen jobs are sent to the LLM."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any
+
+from .cache import SQLiteCache
+from .prompting import project_job, project_preferences, summarize_profile
+
+JOB_MEMO_TTL = float(os.getenv("JOB_MEMO_TTL", "604800"))  # in seconds, 0 disables per-job memoization
+JOB_MEMO_MAX_ENTRIES = int(os.getenv("JOB_MEMO_MAX_ENTRIES", "20000"))  # per node
+
+
+def _digest(value: Any) -> str:  # noqa: ANN401
+    """Hash a JSON-serializable value canonically.
+
+    Args:
+        value (Any): Value to hash.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class JobMemo:
+    """Memoize a node's LLM result per (profile hash, preferences hash, job fingerprint).
+
+    The job fingerprint hashes the job as projected for the node's prompt, so a result is reused only if the LLM would
+    have seen the same job.
+
+    Args:
+        node (str): Node name, a key of `JOB_PROMPT_FIELDS`.
+    """
+
+    def __init__(self, node: str) -> None:
+        self.node = node
+        self._cache = (
+            SQLiteCache(f"{node}_memo", ttl=JOB_MEMO_TTL, max_entries=JOB_MEMO_MAX_ENTRIES)
+            if JOB_MEMO_TTL > 0
+            else None
+        )
+
+    def context(self, profile: dict[str, Any], preferences: dict[str, Any]) -> str:
+        """Hash the profile and the fit-related preferences of a run.
+
+        Args:
+            profile (dict[str, Any]): Extracted candidate profile information.
+            preferences (dict[str, Any]): Candidate job preferences.
+
+        Returns:
+            str: The run context hash.
+        """
+        fit_preferences = project_preferences(preferences, self.node)
+        return f"{_digest(summarize_profile(profile))[:32]}:{_digest(fit_preferences)[:32]}"
+
+    def _key(self, context: str, job: dict[str, Any]) -> str:
+        return f"{context}:{_digest(project_job(job, self.node))}"
+
+    def get_many(self, context: str, jobs: list[dict[str, Any]]) -> dict[int, Any]:
+        """Return the memoized results of the jobs seen in previous runs.
+
+        Args:
+            context (str): Run context from `context`.
+            jobs (list[dict[str, Any]]): Jobs to look up.
+
+        Returns:
+            dict[int, Any]: Memoized results by job index.
+        """
+        if self._cache is None:
+            return {}
+        found: dict[int, Any] = {}
+        for idx, job in enumerate(jobs):
+            value = self._cache.get(self._key(context, job))
+            if value is not None:
+                found[idx] = value
+        if found:
+            print(f"Reused {self.node} results for {len(found)} of {len(jobs)} jobs.")
+        return found
+
+    def set(self, context: str, job: dict[str, Any], value: Any) -> None:  # noqa: ANN401
+        """Memoize the result of a job.
+
+        Args:
+            context (str): Run context from `context`.
+            job (dict[str, Any]): The job.
+            value (Any): JSON-serializable result.
+        """
+        if self._cache is not None:
+            self._cache.set(self._key(context, job), value)
@@ -0,0 +1,41 @@
+"""Helpers to decode the compact job search payloads returned by the MCP server."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+from typing import Any
+
+
+def unpack_jobs(payload: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Decode a job search result into the `{"jobs": [job_dict, ...]}` shape used by the agents.
+
+    Handles gzip+base64 wrapped results and the columnar format, other payloads are returned as is.
+
+    Args:
+        payload (Any): Result of the `job_search_tool` MCP tool.
+
+    Returns:
+        dict[str, Any]: The result with jobs as a list of dicts.
+
+    Raises:
+        ValueError: If a compressed payload cannot be decoded.
+    """
+    if isinstance(payload, dict) and payload.get("encoding") == "gzip+base64":
+        try:
+            payload = json.loads(gzip.decompress(base64.b64decode(payload.get("data") or "")))
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not decode compressed job search result: {e}") from e
+
+    if not isinstance(payload, dict):
+        return {"jobs": payload or []}
+
+    if payload.get("format") == "columnar":
+        table = payload.get("jobs") or {}
+        columns = table.get("columns") or []
+        jobs = [dict(zip(columns, row, strict=False)) for row in table.get("rows") or []]
+        payload = {key: value for key, value in payload.items() if key != "format"}
+        payload["jobs"] = jobs
+
+    return payload
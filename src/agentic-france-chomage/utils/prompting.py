@@ -0,0 +1,227 @@
+"""Helpers to build compact LLM prompt payloads from profiles, preferences and JobSpy jobs."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from typing import Any
+
+# JobSpy fields each node needs to reason about a job
+JOB_PROMPT_FIELDS = {
+    "filtering": ("title", "company", "location", "job_type", "is_remote", "job_level", "description"),
+    "ranking": (
+        "title",
+        "company",
+        "location",
+        "job_type",
+        "is_remote",
+        "job_level",
+        "min_amount",
+        "max_amount",
+        "currency",
+        "interval",
+        "description",
+    ),
+    "description": (
+        "title",
+        "company",
+        "location",
+        "job_type",
+        "is_remote",
+        "job_level",
+        "min_amount",
+        "max_amount",
+        "currency",
+        "interval",
+        "description",
+    ),
+}
+# Token budget of a job description in each node, overridable with PROMPT_<NODE>_DESCRIPTION_TOKENS
+DESCRIPTION_TOKEN_BUDGETS = {
+    node: int(os.getenv(f"PROMPT_{node.upper()}_DESCRIPTION_TOKENS", str(default)))
+    for node, default in {"filtering": 200, "ranking": 400, "description": 400}.items()
+}
+PROFILE_ITEM_MAX_CHARS = int(os.getenv("PROMPT_PROFILE_ITEM_MAX_CHARS", "300"))
+PROFILE_MAX_ITEMS = int(os.getenv("PROMPT_PROFILE_MAX_ITEMS", "8"))  # per list (experiences, projects, ...)
+CHARS_PER_TOKEN = 4  # rough estimate, no tokenizer needed
+# Preferences that only shape the search, they do not change how a given job fits the candidate
+SEARCH_ONLY_PREFERENCES = {"site_name", "results_wanted", "linkedin_fetch_description", "parallel_sites"}
+
+# HTML tags, markdown emphasis/heading/table marks and markdown escapes in JobSpy descriptions
+_MARKUP = re.compile(r"<[^>]+>|[*#`>|]+|\\(?=[^\w\s])")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text.
+
+    Args:
+        text (str): Prompt text.
+
+    Returns:
+        int: Estimated token count.
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _json_chars(value: Any) -> int:  # noqa: ANN401
+    """Approximate the length of the JSON serialization of a value without serializing it.
+
+    Args:
+        value (Any): JSON-like value.
+
+    Returns:
+        int: Approximate number of characters.
+    """
+    if isinstance(value, dict):
+        return 2 + sum(_json_chars(key) + 2 + _json_chars(item) for key, item in value.items()) + 2 * len(value)
+    if isinstance(value, list | tuple):
+        return 2 + sum(_json_chars(item) + 2 for item in value)
+    if isinstance(value, str):
+        return len(value) + 2
+    return len(str(value))
+
+
+def prune(value: Any) -> Any:  # noqa: ANN401
+    """Recursively drop None, NaN and empty values from dicts and lists.
+
+    Args:
+        value (Any): Value to prune.
+
+    Returns:
+        Any: The pruned value, None if it is empty.
+    """
+    if isinstance(value, dict):
+        pruned = {key: prune(item) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item is not None} or None
+    if isinstance(value, list | tuple):
+        pruned_items = [item for item in (prune(item) for item in value) if item is not None]
+        return pruned_items or None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def truncate_text(text: Any, max_tokens: int) -> Any:  # noqa: ANN401
+    """Strip markup and collapse whitespace of a text, then cut it at a word boundary to fit a token budget.
+
+    Args:
+        text (Any): Text to truncate, non strings are returned as is.
+        max_tokens (int): Token budget, 0 or less keeps the whole text.
+
+    Returns:
+        Any: The truncated text.
+    """
+    if not isinstance(text, str):
+        return text
+    cleaned = " ".join(_MARKUP.sub(" ", text).split())
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if max_tokens <= 0 or len(cleaned) <= max_chars:
+        return cleaned
+    return cleaned[:max_chars].rsplit(" ", 1)[0] + "..."
+
+
+def project_job(job: dict[str, Any], node: str) -> dict[str, Any]:
+    """Keep only the fields of a job a node needs, with its description cut to the node's token budget.
+
+    Args:
+        job (dict[str, Any]): Job dict as returned by JobSpy.
+        node (str): Node name, a key of JOB_PROMPT_FIELDS.
+
+    Returns:
+        dict[str, Any]: The projected job.
+    """
+    projected = {field: job.get(field) for field in JOB_PROMPT_FIELDS[node]}
+    projected["description"] = truncate_text(projected.get("description"), DESCRIPTION_TOKEN_BUDGETS.get(node, 0))
+    return prune(projected) or {}
+
+
+def project_preferences(preferences: dict[str, Any], node: str) -> dict[str, Any]:
+    """Keep the preferences a node needs: the search node gets all of them, the others only the fit-related ones.
+
+    Args:
+        preferences (dict[str, Any]): Candidate job preferences.
+        node (str): Node name.
+
+    Returns:
+        dict[str, Any]: The projected preferences.
+    """
+    if node != "search":
+        preferences = {key: value for key, value in preferences.items() if key not in SEARCH_ONLY_PREFERENCES}
+    return prune(preferences) or {}
+
+
+def summarize_profile(profile: dict[str, Any]) -> dict[str, Any]:
+    """Keep the parts of an extracted profile useful to match jobs, without contact details.
+
+    Args:
+        profile (dict[str, Any]): Profile returned by the resume_extractor tool.
+
+    Returns:
+        dict[str, Any]: The summarized profile.
+    """
+
+    def _items(key: str) -> list[Any]:
+        return list(profile.get(key) or [])[:PROFILE_MAX_ITEMS]
+
+    def _experience(item: Any) -> Any:  # noqa: ANN401
+        if not isinstance(item, dict):
+            return truncate_text(item, PROFILE_ITEM_MAX_CHARS // CHARS_PER_TOKEN)
+        return {
+            "role": item.get("role"),
+            "organization": item.get("organization"),
+            "dates": " - ".join(str(item[key]) for key in ("start_date", "end_date") if item.get(key)),
+            "description": truncate_text(item.get("description"), PROFILE_ITEM_MAX_CHARS // CHARS_PER_TOKEN),
+        }
+
+    summary = {
+        "hard_skills": profile.get("hard_skills"),
+        "soft_skills": profile.get("soft_skills"),
+        "languages": profile.get("languages"),
+        "experiences": [_experience(item) for item in _items("experiences")],
+        "education": [_experience(item) for item in _items("education")],
+        "projects": [truncate_text(item, PROFILE_ITEM_MAX_CHARS // CHARS_PER_TOKEN) for item in _items("projects")],
+        "publications": [
+            truncate_text(item, PROFILE_ITEM_MAX_CHARS // CHARS_PER_TOKEN) for item in _items("publications")
+        ],
+        "others": [truncate_text(item, PROFILE_ITEM_MAX_CHARS // CHARS_PER_TOKEN) for item in _items("others")],
+    }
+    return prune(summary) or {}
+
+
+def build_user_payload(
+    node: str,
+    profile: dict[str, Any],
+    preferences: dict[str, Any],
+    jobs: list[dict[str, Any]] | None = None,
+) -> str:
+    """Build the JSON user message of a node's LLM call and log its estimated size before and after slimming.
+
+    Preferences and jobs are projected on what the node needs, and jobs are numbered with an `index` matching their
+    position in jobs.
+
+    Args:
+        node (str): Node name, used for the job projection and in logs.
+        profile (dict[str, Any]): Extracted candidate profile information.
+        preferences (dict[str, Any]): Candidate job preferences.
+        jobs (list[dict[str, Any]] | None): Jobs to include, None for a payload without jobs.
+
+    Returns:
+        str: The JSON user message.
+    """
+    payload: dict[str, Any] = {
+        "profile": summarize_profile(profile),
+        "preferences": project_preferences(preferences, node),
+    }
+    if jobs is not None:
+        payload["jobs"] = [{**project_job(job, node), "index": idx} for idx, job in enumerate(jobs)]
+
+    content = json.dumps(payload, ensure_ascii=False, default=str)
+    raw_tokens = math.ceil(
+        _json_chars({"profile": profile, "preferences": preferences, "jobs": jobs}) / CHARS_PER_TOKEN
+    )
+    print(f"Prompt payload for {node}: ~{raw_tokens} -> ~{estimate_tokens(content)} tokens.")
+    return content
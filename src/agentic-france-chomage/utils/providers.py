@@ -3,20 +3,70 @@
 from __future__ import annotations
 
 import os
+import threading
+from importlib.util import find_spec
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
+from .llm_cache import CachedClient
 
-def nebius_client() -> OpenAI:
-    """Create a Nebius OpenAI-compatible client.
+NEBIUS_BASE_URL = "https://api.tokenfactory.nebius.com/v1"
+NEBIUS_MAX_CONNECTIONS = int(os.getenv("NEBIUS_MAX_CONNECTIONS", "20"))
+NEBIUS_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("NEBIUS_MAX_KEEPALIVE_CONNECTIONS", "10"))
+NEBIUS_KEEPALIVE_EXPIRY = float(os.getenv("NEBIUS_KEEPALIVE_EXPIRY", "60"))  # in seconds
+NEBIUS_HTTP2 = os.getenv("NEBIUS_HTTP2", "false").lower() in {"1", "true", "yes"}
+NEBIUS_TIMEOUT = float(os.getenv("NEBIUS_TIMEOUT", "120"))  # in seconds
+NEBIUS_CONNECT_TIMEOUT = float(os.getenv("NEBIUS_CONNECT_TIMEOUT", "10"))  # in seconds
+# Default timeout per model as "model=seconds,...", used when a call does not set its own
+NEBIUS_MODEL_TIMEOUTS = {
+    model.strip(): float(seconds)
+    for model, _, seconds in (
+        item.rpartition("=")
+        for item in os.getenv("NEBIUS_MODEL_TIMEOUTS", "openai/gpt-oss-20b=60,openai/gpt-oss-120b=180").split(",")
+    )
+    if model.strip() and seconds.strip()
+}
+
+_NEBIUS_CLIENT: CachedClient | None = None
+_NEBIUS_CLIENT_LOCK = threading.Lock()
+
+
+def nebius_client() -> CachedClient:
+    """Return the process-wide Nebius OpenAI-compatible client, creating it on first use.
+
+    The client keeps its connections alive between calls and is safe to share between threads. Its
+    `chat.completions.parse` calls are served from the persistent LLM cache, pass `cache=False` to bypass it.
 
     Returns:
-        OpenAI: Configured Nebius client.
+        CachedClient: Configured Nebius client.
 
     Raises:
         EnvironmentError: If the NEBIUS_API_KEY environment variable is not set.
     """
+    global _NEBIUS_CLIENT
     api_key = os.getenv("NEBIUS_API_KEY", None)
     if api_key is None:
         raise EnvironmentError("Missing NEBIUS_API_KEY for Nebius client.")
-    return OpenAI(base_url="https://api.tokenfactory.nebius.com/v1", api_key=api_key)
+    if _NEBIUS_CLIENT is None:
+        with _NEBIUS_CLIENT_LOCK:
+            if _NEBIUS_CLIENT is None:
+                http2 = NEBIUS_HTTP2 and find_spec("h2") is not None
+                if NEBIUS_HTTP2 and not http2:
+                    print("NEBIUS_HTTP2 is set but the 'h2' package is not installed, falling back to HTTP/1.1.")
+                http_client = DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=NEBIUS_MAX_CONNECTIONS,
+                        max_keepalive_connections=NEBIUS_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=NEBIUS_KEEPALIVE_EXPIRY,
+                    ),
+                    http2=http2,
+                )
+                client = OpenAI(
+                    base_url=NEBIUS_BASE_URL,
+                    api_key=api_key,
+                    timeout=httpx.Timeout(NEBIUS_TIMEOUT, connect=NEBIUS_CONNECT_TIMEOUT),
+                    http_client=http_client,
+                )
+                _NEBIUS_CLIENT = CachedClient(client, model_timeouts=NEBIUS_MODEL_TIMEOUTS)
+    return _NEBIUS_CLIENT
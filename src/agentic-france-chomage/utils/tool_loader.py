@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import base64
+import itertools
 import json
 import os
+import random
 import sys
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 
@@ -20,35 +32,229 @@ BLAXEL_WORKSPACE = os.getenv("BLAXEL_WORKSPACE")
 BLAXEL_SERVER_NAME = os.getenv("BLAXEL_SERVER_NAME")
 BLAXEL_ACCESS_TOKEN = os.getenv("BLAXEL_ACCESS_TOKEN")
 BLAXEL_TIMEOUT = float(os.getenv("BLAXEL_TIMEOUT", "120"))
+BLAXEL_MAX_CONNECTIONS = int(os.getenv("BLAXEL_MAX_CONNECTIONS", "10"))
+BLAXEL_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("BLAXEL_MAX_KEEPALIVE_CONNECTIONS", "5"))
+BLAXEL_KEEPALIVE_EXPIRY = float(os.getenv("BLAXEL_KEEPALIVE_EXPIRY", "60"))
+BLAXEL_HTTP2 = os.getenv("BLAXEL_HTTP2", "false").lower() in {"1", "true", "yes"}
+# resume_extractor is left out by default: the server does not coalesce it, so a retry pays for a second VLM call
+BLAXEL_IDEMPOTENT_TOOLS = set(os.getenv("BLAXEL_IDEMPOTENT_TOOLS", "job_search_tool").split(","))
+BLAXEL_MAX_RETRIES = int(os.getenv("BLAXEL_MAX_RETRIES", "2"))
+# Above the server's JOB_SEARCH_SITE_TIMEOUT (60s) so only stuck calls are retried, not slow deep searches
+BLAXEL_FIRST_TIMEOUT = min(float(os.getenv("BLAXEL_FIRST_TIMEOUT", "90")), BLAXEL_TIMEOUT)
+BLAXEL_BACKOFF_BASE = float(os.getenv("BLAXEL_BACKOFF_BASE", "0.5"))
+BLAXEL_BACKOFF_MAX = float(os.getenv("BLAXEL_BACKOFF_MAX", "8"))
+BLAXEL_HEDGE = os.getenv("BLAXEL_HEDGE", "false").lower() in {"1", "true", "yes"}
+BLAXEL_HEDGE_DELAY = float(os.getenv("BLAXEL_HEDGE_DELAY", "20"))
+BLAXEL_HEDGE_MIN_SAMPLES = int(os.getenv("BLAXEL_HEDGE_MIN_SAMPLES", "20"))
+BLAXEL_BREAKER_WINDOW = int(os.getenv("BLAXEL_BREAKER_WINDOW", "20"))
+BLAXEL_BREAKER_MIN_CALLS = int(os.getenv("BLAXEL_BREAKER_MIN_CALLS", "4"))
+BLAXEL_BREAKER_ERROR_RATE = float(os.getenv("BLAXEL_BREAKER_ERROR_RATE", "0.5"))
+BLAXEL_BREAKER_SLOW_CALL = float(os.getenv("BLAXEL_BREAKER_SLOW_CALL", "90"))
+BLAXEL_BREAKER_COOLDOWN = float(os.getenv("BLAXEL_BREAKER_COOLDOWN", "60"))
+
+_REQUEST_IDS = itertools.count(1)
+
+
+class _SSEDecoder:
+    """Incremental decoder of a Server-Sent Events (SSE) stream carrying JSON-RPC messages.
+
+    Plain JSON bodies (`application/json` responses) are decoded as a single message on flush.
+    """
+
+    def __init__(self) -> None:
+        self._data: list[str] = []
+        self._raw: list[str] = []
+
+    def feed(self, line: str) -> dict | list | None:
+        """Consume one line of the stream.
+
+        Args:
+            line (str): A line of the response, without its line ending.
+
+        Returns:
+            dict | list | None: The JSON message (or batch of messages) completed by this line, or None if the event
+                is not complete yet.
+        """
+        if line.startswith("data:"):
+            self._data.append(line[5:].removeprefix(" "))
+            return None
+        if not line.strip():
+            return self._dispatch()
+        if not line.startswith((":", "event:", "id:", "retry:")):
+            self._raw.append(line)
+        return None
+
+    def flush(self) -> dict | list | None:
+        """Decode what is left once the stream has ended.
+
+        Returns:
+            dict | list | None: The last JSON message (or batch of messages) of the stream, if any.
+        """
+        message = self._dispatch()
+        if message is None and self._raw:
+            message = json.loads("\n".join(self._raw))
+            self._raw = []
+        return message
+
+    def _dispatch(self) -> dict | list | None:
+        """Decode the data lines of the current event.
+
+        Returns:
+            dict | list | None: The JSON message of the event, or None if it has no valid JSON data.
+        """
+        if not self._data:
+            return None
+        data = "\n".join(self._data)
+        self._data = []
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
+
+
+class ToolError(RuntimeError):
+    """Error reported by the remote tool itself (JSON-RPC error or tool result flagged with isError).
+
+    The server answered, so the call is neither retried nor served by the local fallback: it would fail the same way.
+    """
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Tell whether a failed remote call may succeed if retried.
+
+    Args:
+        error (Exception): The error raised by the call.
+
+    Returns:
+        bool: True for connection errors, timeouts and 5xx or 429 responses.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, httpx.TransportError)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff delay before the next attempt.
+
+    Args:
+        attempt (int): Index of the attempt that just failed, starting at 0.
+
+    Returns:
+        float: Delay in seconds.
+    """
+    return random.uniform(0, min(BLAXEL_BACKOFF_MAX, BLAXEL_BACKOFF_BASE * 2**attempt))  # noqa: S311
 
 
 class BlaxelToolWrapper:
     """A wrapper for calling tools hosted on a Blaxel server.
 
+    All wrappers share a long-lived connection pool so consecutive tool calls reuse the same TCP/TLS connections.
+
     Args:
         tool_name (str): Name of the tool to call.
         mcp_url (str): Full URL to the MCP server.
         access_token (str): Access token for authentication.
     """
 
+    _shared_client: httpx.Client | None = None
+    _shared_client_lock = threading.Lock()
+    # One async client per event loop: a client's connections are bound to the loop that opened them
+    _async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+        weakref.WeakKeyDictionary()
+    )
+    # MCP servers following the 2025-06-18 spec reject JSON-RPC batches, remembered per server URL
+    _batch_unsupported: set[str] = set()
+    _latencies: defaultdict[str, deque] = defaultdict(lambda: deque(maxlen=200))
+    _shared_hedge_executor: ThreadPoolExecutor | None = None
+
     def __init__(self, tool_name: str, mcp_url: str, access_token: str) -> None:
         self.tool_name = tool_name
         self.mcp_url = mcp_url
         self.access_token = access_token
+        self.idempotent = tool_name in BLAXEL_IDEMPOTENT_TOOLS
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-        """Execute the rool remotely on the Blaxel server.
+    @classmethod
+    def _client(cls) -> httpx.Client:
+        """Return the shared pooled HTTP client, creating it on first use.
+
+        Returns:
+            httpx.Client: The shared HTTP client.
+        """
+        if cls._shared_client is None:
+            with cls._shared_client_lock:
+                if cls._shared_client is None:
+                    http2 = BLAXEL_HTTP2
+                    if http2 and find_spec("h2") is None:
+                        print("BLAXEL_HTTP2 is set but the 'h2' package is not installed, falling back to HTTP/1.1.")
+                        http2 = False
+                    cls._shared_client = httpx.Client(
+                        timeout=BLAXEL_TIMEOUT,
+                        http2=http2,
+                        limits=httpx.Limits(
+                            max_connections=BLAXEL_MAX_CONNECTIONS,
+                            max_keepalive_connections=BLAXEL_MAX_KEEPALIVE_CONNECTIONS,
+                            keepalive_expiry=BLAXEL_KEEPALIVE_EXPIRY,
+                        ),
+                    )
+        return cls._shared_client
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        with cls._shared_client_lock:
+            if cls._shared_client is not None:
+                cls._shared_client.close()
+                cls._shared_client = None
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the async HTTP client of the running event loop and its pooled connections."""
+        with cls._shared_client_lock:
+            client = cls._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    def _async_client(cls) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client of the running event loop, creating it on first use.
+
+        Each event loop keeps its own client, so switching loops never drops a client with open connections.
+
+        Returns:
+            httpx.AsyncClient: The async HTTP client bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._shared_client_lock:
+            client = cls._async_clients.get(loop)
+            if client is None:
+                # Clients of closed loops cannot be awaited anymore, their sockets are released with them
+                for stale_loop in [other for other in cls._async_clients if other.is_closed()]:
+                    del cls._async_clients[stale_loop]
+                client = httpx.AsyncClient(
+                    timeout=BLAXEL_TIMEOUT,
+                    http2=BLAXEL_HTTP2 and find_spec("h2") is not None,
+                    limits=httpx.Limits(
+                        max_connections=BLAXEL_MAX_CONNECTIONS,
+                        max_keepalive_connections=BLAXEL_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=BLAXEL_KEEPALIVE_EXPIRY,
+                    ),
+                )
+                cls._async_clients[loop] = client
+        return client
+
+    def _build_request(self, args: tuple, kwargs: dict, progress: bool = False) -> tuple[dict, dict]:
+        """Validate the arguments and build the JSON-RPC payload and headers of a tool call.
 
         Args:
-            *args: Positional arguments to pass to the tool.
-            **kwargs: Keyword arguments to pass to the tool.
+            args (tuple): Positional arguments passed to the tool.
+            kwargs (dict): Keyword arguments passed to the tool.
+            progress (bool): Whether to ask the server for progress notifications.
 
         Returns:
-            Any: The tool's response, parsed from JSON if applicable.
+            tuple[dict, dict]: The JSON-RPC payload and the HTTP headers.
 
         Raises:
             TypeError: If no arguments are provided or if positional arguments are used.
-            RuntimeError: If the remote tool call fails.
         """
         if not kwargs and not args:
             msg = f"Tool '{self.tool_name}' requires at least one argument."
@@ -58,16 +264,19 @@ class BlaxelToolWrapper:
             msg = f"Blaxel MCP tool '{self.tool_name}' does not support positional arguments."
             raise TypeError(msg)
 
-        processed_kwargs = self._processed_file_arguments(kwargs)
+        request_id = next(_REQUEST_IDS)
+        params: dict[str, Any] = {
+            "name": self.tool_name,
+            "arguments": self._processed_file_arguments(kwargs),
+        }
+        if progress:
+            params["_meta"] = {"progressToken": request_id}
 
         payload = {
             "jsonrpc": "2.0",
             "method": "tools/call",
-            "params": {
-                "name": self.tool_name,
-                "arguments": processed_kwargs,
-            },
-            "id": 1,
+            "params": params,
+            "id": request_id,
         }
 
         headers = {
@@ -75,83 +284,414 @@ class BlaxelToolWrapper:
             "Content-Type": "application/json",
             "Accept": "application/json, text/event-stream",
         }
+        return payload, headers
 
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Execute the rool remotely on the Blaxel server.
+
+        Idempotent tools (BLAXEL_IDEMPOTENT_TOOLS) are retried with jittered exponential backoff on connection
+        errors, timeouts and 5xx/429 responses, the first attempt using the shorter BLAXEL_FIRST_TIMEOUT. With
+        BLAXEL_HEDGE enabled, a duplicate request is sent when the first one exceeds the p95 latency of the tool and
+        the first answer wins.
+
+        Args:
+            *args: Positional arguments to pass to the tool.
+            **kwargs: Keyword arguments to pass to the tool.
+
+        Returns:
+            Any: The tool's response, parsed from JSON if applicable.
+
+        Raises:
+            TypeError: If no arguments are provided or if positional arguments are used.
+            ToolError: If the remote tool reported an error.
+            RuntimeError: If the remote tool call fails.
+        """
+        payload, headers = self._build_request(args, kwargs)
+        attempts = 1 + BLAXEL_MAX_RETRIES if self.idempotent else 1
+
+        for attempt in range(attempts):
+            timeout = BLAXEL_FIRST_TIMEOUT if attempt == 0 and attempts > 1 else BLAXEL_TIMEOUT
+            try:
+                if self.idempotent and BLAXEL_HEDGE:
+                    return self._hedged_send(payload, headers, timeout)
+                return self._send(payload, headers, timeout)
+            except ToolError:
+                raise
+            except Exception as e:
+                if attempt == attempts - 1 or not _is_retryable(e):
+                    raise self._as_runtime_error(e) from e
+                delay = _backoff_delay(attempt)
+                print(f"Blaxel MCP tool '{self.tool_name}' failed ({type(e).__name__}), retry in {delay:.1f}s.")
+                time.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    async def acall(
+        self,
+        progress_callback: Callable[[dict], None] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """Execute the tool remotely without blocking the event loop, consuming the SSE stream as it arrives.
+
+        The call returns as soon as the JSON-RPC result frame is received, without buffering the whole response.
+        Idempotent tools are retried like synchronous calls.
+
+        Args:
+            progress_callback (Callable[[dict], None] | None): Called with the params of each progress notification
+                (progress, total, message) sent by the server while the tool runs.
+            **kwargs: Keyword arguments to pass to the tool.
+
+        Returns:
+            Any: The tool's response, parsed from JSON if applicable.
+
+        Raises:
+            TypeError: If no arguments are provided.
+            ToolError: If the remote tool reported an error.
+            RuntimeError: If the remote tool call fails.
+        """
+        payload, headers = self._build_request((), kwargs, progress=progress_callback is not None)
+        attempts = 1 + BLAXEL_MAX_RETRIES if self.idempotent else 1
+
+        for attempt in range(attempts):
+            timeout = BLAXEL_FIRST_TIMEOUT if attempt == 0 and attempts > 1 else BLAXEL_TIMEOUT
+            try:
+                return await self._asend(payload, headers, timeout, progress_callback)
+            except ToolError:
+                raise
+            except Exception as e:
+                if attempt == attempts - 1 or not _is_retryable(e):
+                    raise self._as_runtime_error(e) from e
+                delay = _backoff_delay(attempt)
+                print(f"Blaxel MCP tool '{self.tool_name}' failed ({type(e).__name__}), retry in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def _send(self, payload: dict, headers: dict, timeout: float) -> Any:  # noqa: ANN401
+        """Send one tools/call request and return its result, recording the latency of successful calls.
+
+        Args:
+            payload (dict): JSON-RPC payload.
+            headers (dict): HTTP headers.
+            timeout (float): Request timeout in seconds.
+
+        Returns:
+            Any: The tool's response, parsed from JSON if applicable.
+
+        Raises:
+            RuntimeError: If the server returned an empty response or an error.
+        """
+        start = time.monotonic()
+        client = self._client()
+        with client.stream("POST", self.mcp_url, json=payload, headers=headers, timeout=timeout) as response:
+            if response.is_error:
+                response.read()
+            response.raise_for_status()
+
+            decoder = _SSEDecoder()
+            message = None
+            for line in response.iter_lines():
+                message = decoder.feed(line)
+                if message is not None and message.get("id") == payload["id"]:
+                    break
+            else:
+                message = decoder.flush()
+
+        if message is None or message.get("id") != payload["id"]:
+            raise RuntimeError(f"Blaxel MCP tool '{self.tool_name}' returned empty response.")
+
+        result = self._extract_result(message)
+        self._latencies[self.tool_name].append(time.monotonic() - start)
+        return result
+
+    def _hedged_send(self, payload: dict, headers: dict, timeout: float) -> Any:  # noqa: ANN401
+        """Send a request and a duplicate one if it is slower than the hedge delay, returning the first answer.
+
+        The slower request cannot be interrupted and completes in the background, its result is discarded.
+
+        Args:
+            payload (dict): JSON-RPC payload.
+            headers (dict): HTTP headers.
+            timeout (float): Request timeout in seconds.
+
+        Returns:
+            Any: The tool's response, parsed from JSON if applicable.
+        """
+        executor = self._hedge_executor()
+        primary = executor.submit(self._send, payload, headers, timeout)
+        delay = self._hedge_delay()
         try:
-            with httpx.Client(timeout=BLAXEL_TIMEOUT) as client:
-                response = client.post(
-                    self.mcp_url,
-                    json=payload,
-                    headers=headers,
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            print(f"Blaxel MCP tool '{self.tool_name}' slower than {delay:.1f}s, sending a hedged request.")
+
+        pending = {primary, executor.submit(self._send, payload, headers, timeout)}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _hedge_delay(self) -> float:
+        """Return the delay before hedging: the p95 latency of the tool, or BLAXEL_HEDGE_DELAY without enough samples.
+
+        Returns:
+            float: Hedge delay in seconds.
+        """
+        samples = sorted(self._latencies[self.tool_name])
+        if len(samples) < BLAXEL_HEDGE_MIN_SAMPLES:
+            return BLAXEL_HEDGE_DELAY
+        return samples[int(0.95 * (len(samples) - 1))]
+
+    @classmethod
+    def _hedge_executor(cls) -> ThreadPoolExecutor:
+        """Return the thread pool running hedged requests, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The hedged requests thread pool.
+        """
+        with cls._shared_client_lock:
+            if cls._shared_hedge_executor is None:
+                cls._shared_hedge_executor = ThreadPoolExecutor(
+                    max_workers=BLAXEL_MAX_CONNECTIONS, thread_name_prefix="blaxel-hedge"
                 )
-                response.raise_for_status()
+            return cls._shared_hedge_executor
+
+    async def _asend(
+        self,
+        payload: dict,
+        headers: dict,
+        timeout: float,
+        progress_callback: Callable[[dict], None] | None,
+    ) -> Any:  # noqa: ANN401
+        """Send one tools/call request on the async client, consuming the SSE stream incrementally.
+
+        Args:
+            payload (dict): JSON-RPC payload.
+            headers (dict): HTTP headers.
+            timeout (float): Request timeout in seconds.
+            progress_callback (Callable[[dict], None] | None): Called with the params of each progress notification.
 
-                sse_data = self._parse_sse_response(response.text)
+        Returns:
+            Any: The tool's response, parsed from JSON if applicable.
+
+        Raises:
+            RuntimeError: If the server returned an empty response or an error.
+        """
+        start = time.monotonic()
+        client = self._async_client()
+        async with client.stream("POST", self.mcp_url, json=payload, headers=headers, timeout=timeout) as response:
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+
+            decoder = _SSEDecoder()
+            message = None
+            async for line in response.aiter_lines():
+                message = decoder.feed(line)
+                if message is None:
+                    continue
+                if message.get("method") == "notifications/progress":
+                    if progress_callback is not None:
+                        progress_callback(message.get("params", {}))
+                    message = None
+                    continue
+                if message.get("id") == payload["id"]:
+                    break
+            else:
+                message = decoder.flush()
 
-                if not sse_data:
-                    msg = f"Blaxel MCP tool '{self.tool_name}' returned empty response."
-                    raise RuntimeError(msg)
+        if message is None or message.get("id") != payload["id"]:
+            raise RuntimeError(f"Blaxel MCP tool '{self.tool_name}' returned empty response.")
 
-                all_text_contents = []
+        result = self._extract_result(message)
+        self._latencies[self.tool_name].append(time.monotonic() - start)
+        return result
 
-                for data in sse_data:
-                    result = data.get("result", {})
+    def _as_runtime_error(self, error: Exception) -> RuntimeError:
+        """Convert a failed call error into the RuntimeError raised to the caller.
 
-                    if result.get("isError"):
-                        error_msg = "Unknown error"
-                        if "content" in result and result["content"]:
-                            error_msg = result["content"][0].get("text", error_msg)
-                        raise RuntimeError(f"Blaxel remote tool error: {error_msg}")
+        Args:
+            error (Exception): The error raised by the call.
 
-                    content = result.get("content", [])
-                    for item in content:
-                        if item.get("type") == "text" and item.get("text"):
-                            all_text_contents.append(item["text"])
+        Returns:
+            RuntimeError: The error to raise.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+            msg = f"Blaxel MCP tool '{self.tool_name}' failed with status {response.status_code}: {response.text}"
+        elif isinstance(error, httpx.RequestError):
+            msg = f"Blaxel MCP tool '{self.tool_name}' request failed: {error!r}"
+        elif isinstance(error, json.JSONDecodeError):
+            msg = f"Blaxel MCP tool '{self.tool_name}' returned invalid JSON: {error}"
+        else:
+            msg = f"Blaxel MCP tool '{self.tool_name}' encountered an unexpected error: {error}"
+        return RuntimeError(msg)
+
+    def batch(self, calls: list[dict[str, Any]], return_exceptions: bool = False) -> list[Any]:
+        """Execute several calls of the tool in a single JSON-RPC batch request.
+
+        Responses are matched to the calls by request id. If the server does not accept batches, the calls are sent
+        concurrently as individual requests on the shared connection pool instead.
 
-                if not all_text_contents:
-                    return {}
+        Args:
+            calls (list[dict[str, Any]]): Keyword arguments of each call.
+            return_exceptions (bool): Whether to return the RuntimeError of a failed call in place of its result
+                instead of raising it.
 
-                parsed_result = []
-                for text in all_text_contents:
-                    try:
-                        parsed_result.append(json.loads(text))
-                    except json.JSONDecodeError:
-                        parsed_result.append(text)
+        Returns:
+            list[Any]: The response of each call, in the order of calls.
+
+        Raises:
+            RuntimeError: If a call fails and return_exceptions is False.
+        """
+        if not calls:
+            return []
+
+        if len(calls) == 1 or self.mcp_url in self._batch_unsupported:
+            results = self._call_concurrently(calls)
+        else:
+            results = self._call_batch(calls)
+            if results is None:
+                print(f"Blaxel MCP server does not support batching, sending {len(calls)} calls concurrently.")
+                self._batch_unsupported.add(self.mcp_url)
+                results = self._call_concurrently(calls)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, RuntimeError):
+                    raise result
+        return results
+
+    def _call_batch(self, calls: list[dict[str, Any]]) -> list[Any] | None:
+        """Send the calls as one JSON-RPC batch and demultiplex the responses by id.
+
+        Args:
+            calls (list[dict[str, Any]]): Keyword arguments of each call.
+
+        Returns:
+            list[Any] | None: The result or RuntimeError of each call, or None if the server rejected the batch.
+
+        Raises:
+            RuntimeError: If the batch request fails.
+        """
+        requests = [self._build_request((), kwargs) for kwargs in calls]
+        payloads = [payload for payload, _ in requests]
+        headers = requests[0][1]
+        pending = {payload["id"] for payload in payloads}
+        messages: dict[int, dict] = {}
+
+        try:
+            client = self._client()
+            with client.stream("POST", self.mcp_url, json=payloads, headers=headers) as response:
+                if response.status_code in {400, 404, 405, 415, 422}:
+                    return None
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
 
-                return parsed_result[0] if len(parsed_result) == 1 else parsed_result
+                def _collect(message: dict | list | None) -> None:
+                    for item in message if isinstance(message, list) else [message]:
+                        if isinstance(item, dict) and item.get("id") in pending:
+                            pending.discard(item["id"])
+                            messages[item["id"]] = item
+
+                decoder = _SSEDecoder()
+                for line in response.iter_lines():
+                    _collect(decoder.feed(line))
+                    if not pending:
+                        break
+                else:
+                    _collect(decoder.flush())
 
-        except httpx.HTTPError as e:
-            msg = f"Blaxel MCP tool '{self.tool_name}' failed with status {e.response.status_code}: {e.response.text}"
+        except httpx.HTTPStatusError as e:
+            msg = f"Blaxel MCP batch '{self.tool_name}' failed with status {e.response.status_code}: {e.response.text}"
             raise RuntimeError(msg) from e
 
         except httpx.RequestError as e:
-            msg = f"Blaxel MCP tool '{self.tool_name}' request failed: {e}"
+            msg = f"Blaxel MCP batch '{self.tool_name}' request failed: {e}"
             raise RuntimeError(msg) from e
 
         except json.JSONDecodeError as e:
-            msg = f"Blaxel MCP tool '{self.tool_name}' returned invalid JSON: {e}"
+            msg = f"Blaxel MCP batch '{self.tool_name}' returned invalid JSON: {e}"
             raise RuntimeError(msg) from e
 
-        except Exception as e:
-            msg = f"Blaxel MCP tool '{self.tool_name}' encountered an unexpected error: {e}"
-            raise RuntimeError(msg) from e
+        if not messages:
+            return None
+
+        results: list[Any] = []
+        for payload in payloads:
+            message = messages.get(payload["id"])
+            if message is None:
+                results.append(RuntimeError(f"Blaxel MCP tool '{self.tool_name}' returned no response in batch."))
+                continue
+            try:
+                results.append(self._extract_result(message))
+            except RuntimeError as e:
+                results.append(e)
+        return results
 
-    def _parse_sse_response(self, sse_text: str) -> dict:
-        """Parse Server-Sent Events (SSE) reponse from Blaxel.
+    def _call_concurrently(self, calls: list[dict[str, Any]]) -> list[Any]:
+        """Send the calls as individual concurrent requests.
 
         Args:
-            sse_text (str): The raw SSE response text.
+            calls (list[dict[str, Any]]): Keyword arguments of each call.
 
         Returns:
-            dict: The parsed JSON result from the SSE data.
+            list[Any]: The result or RuntimeError of each call.
         """
-        results = []
-        for line in sse_text.strip().split("\n"):
-            if line.startswith("data: "):
-                try:
-                    results.append(json.loads(line[6:].strip()))
-                except json.JSONDecodeError:
-                    continue
-        return results
+
+        def _call(kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+            try:
+                return self(**kwargs)
+            except RuntimeError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(len(calls), BLAXEL_MAX_CONNECTIONS)) as executor:
+            return list(executor.map(_call, calls))
+
+    def _extract_result(self, message: dict) -> Any:  # noqa: ANN401
+        """Extract the tool output from a JSON-RPC response message.
+
+        Args:
+            message (dict): The JSON-RPC response matching the request id.
+
+        Returns:
+            Any: The text contents of the result, parsed from JSON if applicable.
+
+        Raises:
+            ToolError: If the server returned a JSON-RPC error or a tool error.
+        """
+        if "error" in message:
+            error = message["error"] or {}
+            raise ToolError(f"Blaxel remote tool error: {error.get('message', 'Unknown error')}")
+
+        result = message.get("result", {})
+
+        if result.get("isError"):
+            error_msg = "Unknown error"
+            if "content" in result and result["content"]:
+                error_msg = result["content"][0].get("text", error_msg)
+            raise ToolError(f"Blaxel remote tool error: {error_msg}")
+
+        all_text_contents = [
+            item["text"] for item in result.get("content", []) if item.get("type") == "text" and item.get("text")
+        ]
+
+        if not all_text_contents:
+            return {}
+
+        parsed_result = []
+        for text in all_text_contents:
+            try:
+                parsed_result.append(json.loads(text))
+            except json.JSONDecodeError:
+                parsed_result.append(text)
+
+        return parsed_result[0] if len(parsed_result) == 1 else parsed_result
 
     def _processed_file_arguments(self, kwargs: dict) -> dict:
         """Process arguments to convert local file paths to base64 for remote execution.
@@ -184,6 +724,172 @@ class BlaxelToolWrapper:
         return processed
 
 
+atexit.register(BlaxelToolWrapper.close)
+
+
+class CircuitBreaker:
+    """Client-side circuit breaker tracking the error rate and latency of a remote tool.
+
+    The circuit opens when, over the last BLAXEL_BREAKER_WINDOW calls, the share of failed or slow calls exceeds
+    BLAXEL_BREAKER_ERROR_RATE. After BLAXEL_BREAKER_COOLDOWN seconds it half-opens and lets a single probe call
+    through: a success closes it, a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self) -> None:
+        self.state = self.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=BLAXEL_BREAKER_WINDOW)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Tell whether the next call may go to the remote tool.
+
+        Returns:
+            bool: True when closed, or when half-open and no probe is running yet.
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= BLAXEL_BREAKER_COOLDOWN:
+                self.state = self.HALF_OPEN
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record(self, success: bool, latency: float) -> None:
+        """Record the outcome of a remote call and update the circuit state.
+
+        Args:
+            success (bool): Whether the call succeeded.
+            latency (float): Duration of the call in seconds, calls slower than BLAXEL_BREAKER_SLOW_CALL count as
+                failures.
+        """
+        healthy = success and latency <= BLAXEL_BREAKER_SLOW_CALL
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if healthy:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open()
+                return
+
+            self._outcomes.append(healthy)
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= BLAXEL_BREAKER_MIN_CALLS
+                and failures / len(self._outcomes) >= BLAXEL_BREAKER_ERROR_RATE
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """Let another probe through after a call whose outcome says nothing about the remote health."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        """Open the circuit, the caller holds the lock."""
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+
+class RoutingTool:
+    """A tool routing calls to the remote Blaxel tool, or to the local tool while the remote one is unhealthy.
+
+    Remote failures (transport errors, timeouts and 5xx responses) are served by the local tool when it can be
+    imported. While the circuit breaker is open, calls go straight to the local tool instead of waiting for the remote
+    timeout. Errors reported by the tool itself are raised as is.
+
+    Args:
+        tool_name (str): Name of the tool.
+        remote (BlaxelToolWrapper): The remote tool.
+    """
+
+    def __init__(self, tool_name: str, remote: BlaxelToolWrapper) -> None:
+        self.tool_name = tool_name
+        self.remote = remote
+        self.breaker = CircuitBreaker()
+        self._local: Any = None
+        self._local_error: str | None = None
+        self._local_lock = threading.Lock()
+
+    def _local_tool(self) -> Any | None:  # noqa: ANN401
+        """Import the local tool on first use.
+
+        Returns:
+            Any | None: The local tool callable, or None if it cannot be imported.
+        """
+        with self._local_lock:
+            if self._local is None and self._local_error is None:
+                try:
+                    self._local = _load_local_tool(self.tool_name)
+                except ImportError as e:
+                    self._local_error = str(e)
+                    print(f"No local fallback for tool '{self.tool_name}': {e}")
+            return self._local
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Execute the tool remotely, or locally when the remote tool fails or its circuit is open.
+
+        Args:
+            *args: Positional arguments to pass to the tool.
+            **kwargs: Keyword arguments to pass to the tool.
+
+        Returns:
+            Any: The tool's response.
+
+        Raises:
+            ToolError: If the remote tool reported an error.
+            RuntimeError: If the remote tool call fails and no local fallback is available.
+        """
+        if not self.breaker.allow_request():
+            local = self._local_tool()
+            if local is not None:
+                print(f"Circuit open for remote tool '{self.tool_name}', using the local tool.")
+                return local(*args, **kwargs)
+
+        start = time.monotonic()
+        try:
+            result = self.remote(*args, **kwargs)
+        except ToolError:
+            self.breaker.release()
+            raise
+        except RuntimeError:
+            self.breaker.record(success=False, latency=time.monotonic() - start)
+            local = self._local_tool()
+            if local is None:
+                raise
+            print(f"Remote tool '{self.tool_name}' failed, using the local tool.")
+            return local(*args, **kwargs)
+
+        self.breaker.record(success=True, latency=time.monotonic() - start)
+        return result
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Expose the remote tool API (acall, batch, ...) on the routing tool.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: The attribute of the remote tool.
+
+        Raises:
+            AttributeError: If the routing tool is not initialized yet.
+        """
+        if name == "remote":
+            raise AttributeError(name)
+        return getattr(self.remote, name)
+
+
 def _ensure_tools_on_path() -> Path:
     """Add the MCP tools directory to sys.path if needed.
 
@@ -246,6 +952,8 @@ def _load_blaxel_tool(tool_name: str) -> BlaxelToolWrapper:
 def load_tool(tool_name: str, is_remote: bool = True) -> Any:  # noqa: ANN401
     """Import a tool callable with Blaxel remote support and local fallback.
 
+    Remote tools are wrapped in a RoutingTool that falls back to the local tool at call time while Blaxel fails.
+
     Args:
         tool_name (str): The name of the tool to import.
         is_remote (bool): Whether to load the tool as a remote Blaxel tool first.
@@ -260,8 +968,8 @@ def load_tool(tool_name: str, is_remote: bool = True) -> Any:  # noqa: ANN401
 
     if is_remote:
         try:
-            tool = _load_blaxel_tool(tool_name)
-            print(f"Loaded remote Blaxel tool '{tool_name}'.")
+            tool = RoutingTool(tool_name, _load_blaxel_tool(tool_name))
+            print(f"Loaded remote Blaxel tool '{tool_name}' with local fallback.")
             print(errors)
             return tool
         except Exception as e:
@@ -44,13 +44,16 @@ Here are some limitations to be aware of:
   requests. Use Indeed or Glassdoor for better results and less blocking. Google Jobs search is also a good alternative
   but the search terms need to be well defined. In any case, use this tool responsibly and avoid sending too many
   requests in a short period of time.
-- LinkedIn Deep Search may take longer to retrieve results as it fetches full job descriptions.
+- LinkedIn Deep Search may take longer to retrieve results as it fetches full job descriptions. Enable Parallel Site
+  Search to scrape each site in its own worker: a site that exceeds its timeout (`JOB_SEARCH_SITE_TIMEOUT`) is skipped
+  and reported in the `sites` status block instead of delaying the other results.
 - The Job Search Tool relies on web scraping, which may be affected by changes in the target websites' structure.
 - The Job Search Tool does not implement all the features, filters, and options available in JobSpy. We only implemented
   the most interesting ones from our point of view and our users' needs.
 - Look at [JobSpy documentation](https://github.com/speedyapply/JobSpy) for more details on the job search tool
   capabilities.
-- The Resume Extractor currently only supports resumes in PDF format and with a single page.
+- The Resume Extractor currently only supports resumes in PDF format. Only the first pages (3 by default, see
+  `RESUME_MAX_PAGES`) are analyzed.
 
 ## 👩🏼‍⚖️ Licence & Acknowledgements
 Licence is MIT.
@@ -93,6 +96,8 @@ job_interface = gr.Interface(
         gr.components.Number(label="Max jobs to retrieve", placeholder=10, maximum=25),
         gr.components.Number(label="Job posting since... (hours)", placeholder=72),
         gr.components.Checkbox(value=False, label="LinkedIn Deep Search"),
+        gr.components.Checkbox(value=False, label="Parallel Site Search (per-site timeout)"),
+        gr.components.Checkbox(value=True, label="Merge Duplicate Jobs Across Sites"),
     ],
     outputs=[gr.components.JSON()],
     title="Job Search Tool",
@@ -108,7 +113,7 @@ resume_interface = gr.Interface(
     title="Resume Extractor",
     description=(
         "A Resume Extractor tool using a VLM to analyze your resume and "
-        "extract relevant information. ❗ Only resumes with 1 page and in PDF format are supported."
+        "extract relevant information. ❗ Only resumes in PDF format are supported, up to 3 pages are analyzed."
     ),
 )
 
@@ -1,6 +1,11 @@
 """France Chômage MCP server file for deployement on Blaxel platform."""
 
+import asyncio
+import hashlib
+import json
 import os
+from collections.abc import Callable
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 from tools import job_search_tool as job_search_mcp_tool
@@ -16,9 +21,35 @@ mcp = FastMCP(
     ),
 )
 
+_IN_FLIGHT: dict[str, asyncio.Task] = {}
+
+
+async def _single_flight(key: str, fn: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+    """Run fn in a worker thread, sharing the result with concurrent callers using the same key.
+
+    The first caller starts the call, later callers with the same key await the same task until it completes.
+
+    Args:
+        key (str): Key identifying identical requests.
+        fn (Callable[..., Any]): Blocking function to run.
+        *args (Any): Positional arguments passed to fn.
+
+    Returns:
+        Any: The result of fn.
+    """
+    task = _IN_FLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        _IN_FLIGHT[key] = task
+        task.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+    else:
+        print(f"Joining in-flight request {key[:12]} ({fn.__name__}).")
+    # Shield the shared task so a cancelled caller does not cancel it for the others
+    return await asyncio.shield(task)
+
 
 @mcp.tool()
-def job_search_tool(
+async def job_search_tool(
     site_name: list | str,
     search_term: str,
     google_search_term: str,
@@ -29,6 +60,12 @@ def job_search_tool(
     results_wanted: int,
     hours_old: int,
     linkedin_fetch_description: bool,
+    parallel_sites: bool = False,
+    deduplicate: bool = True,
+    fields: list[str] | None = None,
+    max_description_chars: int | None = None,
+    response_format: str = "records",
+    compress: bool = False,
 ) -> dict:
     """Search for jobs using the scraper from JobSpy.
 
@@ -43,11 +80,45 @@ def job_search_tool(
         results_wanted (int): The number of job listings to retrieve for each site.
         hours_old (int): The maximum age of job listings in hours (ZipRecruiter and Glassdoor round up to next days).
         linkedin_fetch_description (bool): Whether to fetch full description and direct job url for LinkedIn.
+        parallel_sites (bool): Whether to scrape each site in its own worker with a per-site timeout. Sites that
+            miss their deadline are skipped and reported in the `sites` status block.
+        deduplicate (bool): Whether to merge the same posting found on several sites into one job listing the
+            sites and URLs of its duplicates under `sites` and `source_urls`. The number of merged rows is
+            reported under `deduplicated`.
+        fields (list[str] | None): JobSpy columns to return (e.g. title, company, location, job_url, description).
+            All columns are returned when empty.
+        max_description_chars (int | None): Truncate job descriptions to this number of characters.
+        response_format (str): "records" for a list of job dicts, or "columnar" for
+            `{"columns": [...], "rows": [[...], ...]}` which does not repeat the keys for each job.
+        compress (bool): Whether to return large results as `{"encoding": "gzip+base64", "data": ...}`, the
+            base64 of the gzipped JSON result.
 
     Returns:
-        dict: A dict containing of the retrieved job informations.
+        dict: A dict containing the retrieved jobs under `jobs` and, in parallel mode, a status per site under `sites`.
     """
-    return job_search_mcp_tool(
+    params = {
+        "site_name": sorted([site_name] if isinstance(site_name, str) else site_name),
+        "search_term": search_term,
+        "google_search_term": google_search_term,
+        "location": location,
+        "distance": distance,
+        "job_type": job_type,
+        "is_remote": is_remote,
+        "results_wanted": results_wanted,
+        "hours_old": hours_old,
+        "linkedin_fetch_description": linkedin_fetch_description,
+        "parallel_sites": parallel_sites,
+        "deduplicate": deduplicate,
+        "fields": fields,
+        "max_description_chars": max_description_chars,
+        "response_format": response_format,
+        "compress": compress,
+    }
+    key = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    return await _single_flight(
+        key,
+        job_search_mcp_tool,
         site_name,
         search_term,
         google_search_term,
@@ -58,11 +129,17 @@ def job_search_tool(
         results_wanted,
         hours_old,
         linkedin_fetch_description,
+        parallel_sites,
+        deduplicate,
+        fields,
+        max_description_chars,
+        response_format,
+        compress,
     )
 
 
 @mcp.tool()
-def resume_extractor(resume_file: str) -> dict:
+async def resume_extractor(resume_file: str) -> dict:
     """Extract relevant information from a resume using a VLM.
 
     The return dict contains the following fields (ResumeData model):
@@ -91,7 +168,8 @@ def resume_extractor(resume_file: str) -> dict:
     Returns:
         dict: Extracted information from the resume in JSON format based on ResumeData model.
     """
-    return resume_extractor_mcp_tool(resume_file)
+    # Run in a worker thread so rasterization and the VLM call do not block job searches on the event loop
+    return await asyncio.to_thread(resume_extractor_mcp_tool, resume_file)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,373 @@
 """MCP Tool for Job Search Assistance using JobSpy."""
 
+import base64
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import numpy as np
+import pandas as pd
 from jobspy import scrape_jobs
 
+from .cache import SQLiteCache
+
+JOB_SEARCH_MAX_WORKERS = int(os.getenv("JOB_SEARCH_MAX_WORKERS", "4"))
+JOB_SEARCH_SITE_TIMEOUT = float(os.getenv("JOB_SEARCH_SITE_TIMEOUT", "60"))  # in seconds
+
+JOB_SEARCH_CACHE_TTL = float(os.getenv("JOB_SEARCH_CACHE_TTL", "900"))  # in seconds, 0 disables the cache
+JOB_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("JOB_SEARCH_CACHE_MAX_ENTRIES", "512"))
+JOB_SEARCH_HOURS_BUCKET = int(os.getenv("JOB_SEARCH_HOURS_BUCKET", "24"))  # in hours
+JOB_SEARCH_GZIP_MIN_BYTES = int(os.getenv("JOB_SEARCH_GZIP_MIN_BYTES", "32768"))
+
+JOB_DEDUP_SIMILARITY = float(os.getenv("JOB_DEDUP_SIMILARITY", "0.8"))  # estimated Jaccard of the descriptions
+JOB_DEDUP_NUM_PERM = int(os.getenv("JOB_DEDUP_NUM_PERM", "64"))
+JOB_DEDUP_BANDS = int(os.getenv("JOB_DEDUP_BANDS", "16"))
+JOB_DEDUP_SHINGLE_SIZE = 5  # in words
+JOB_DEDUP_MIN_SHINGLES = 20  # shorter descriptions are only matched on their keys
+
+_MINHASH_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+_MINHASH_RNG = np.random.default_rng(seed=1)
+_MINHASH_A = _MINHASH_RNG.integers(1, _MINHASH_PRIME, size=JOB_DEDUP_NUM_PERM, dtype=np.uint64)
+_MINHASH_B = _MINHASH_RNG.integers(0, _MINHASH_PRIME, size=JOB_DEDUP_NUM_PERM, dtype=np.uint64)
+# Gender markers of French job titles, e.g. "(H/F)", "F/H", "(h/f/x)"
+_GENDER_MARKER = re.compile(r"\(?\b[hfmx](?:\s*/\s*[hfmx]){1,2}\b\)?")
+
+_SEARCH_CACHE = (
+    SQLiteCache("job_search", ttl=JOB_SEARCH_CACHE_TTL, max_entries=JOB_SEARCH_CACHE_MAX_ENTRIES)
+    if JOB_SEARCH_CACHE_TTL > 0
+    else None
+)
+
+
+def _bucket_hours(hours_old: int | None) -> int | None:
+    """Round hours_old up to the next cache bucket so close values share the same results.
+
+    Args:
+        hours_old (int | None): The maximum age of job listings in hours.
+
+    Returns:
+        int | None: The bucketed maximum age, or None when no age limit is set.
+    """
+    if not hours_old or JOB_SEARCH_HOURS_BUCKET <= 0:
+        return hours_old
+    return math.ceil(hours_old / JOB_SEARCH_HOURS_BUCKET) * JOB_SEARCH_HOURS_BUCKET
+
+
+def job_search_key(sites: list[str], scrape_kwargs: dict[str, Any]) -> str:
+    """Build a stable key identifying a search, normalizing case, whitespace and hours_old.
+
+    Args:
+        sites (list[str]): Job sites to scrape.
+        scrape_kwargs (dict[str, Any]): Keyword arguments passed to `scrape_jobs` (without `site_name`).
+
+    Returns:
+        str: SHA-256 hex digest of the normalized search parameters.
+    """
+
+    def _normalize(value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, str):
+            return " ".join(value.lower().split())
+        return value
+
+    normalized = {key: _normalize(value) for key, value in scrape_kwargs.items() if key != "verbose"}
+    normalized["site_name"] = sorted(_normalize(site) for site in sites)
+    normalized["hours_old"] = _bucket_hours(scrape_kwargs.get("hours_old"))
+    canonical = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _filter_hours_old(jobs_df: pd.DataFrame, hours_old: int | None) -> pd.DataFrame:
+    """Drop jobs posted before the requested age limit from a superset scraped with a bucketed hours_old.
+
+    `date_posted` only has a day granularity, so jobs posted on the cutoff day are kept, as are jobs without a date.
+
+    Args:
+        jobs_df (pd.DataFrame): Jobs scraped or cached for the bucketed hours_old.
+        hours_old (int | None): The requested maximum age of job listings in hours.
+
+    Returns:
+        pd.DataFrame: The jobs posted within hours_old.
+    """
+    if not hours_old or jobs_df.empty or "date_posted" not in jobs_df.columns:
+        return jobs_df
+    cutoff = (pd.Timestamp.now() - pd.Timedelta(hours=hours_old)).normalize()
+    posted = pd.to_datetime(jobs_df["date_posted"], errors="coerce")
+    return jobs_df[posted.isna() | (posted >= cutoff)].reset_index(drop=True)
+
+
+def _scrape(sites: list[str], scrape_kwargs: dict[str, Any]) -> tuple[pd.DataFrame, bool]:
+    """Scrape jobs through the search cache.
+
+    Searches are cached for the bucketed hours_old and filtered back to the requested one. Empty results are not
+    cached, since they are often caused by a blocked or failing site.
+
+    Args:
+        sites (list[str]): Job sites to scrape.
+        scrape_kwargs (dict[str, Any]): Keyword arguments passed to `scrape_jobs` (without `site_name`).
+
+    Returns:
+        tuple[pd.DataFrame, bool]: The jobs found and whether they were served from the cache.
+    """
+    if _SEARCH_CACHE is None:
+        return scrape_jobs(site_name=sites, **scrape_kwargs), False
+
+    hours_old = scrape_kwargs.get("hours_old")
+    key = job_search_key(sites, scrape_kwargs)
+    cached = _SEARCH_CACHE.get(key)
+    if cached is not None:
+        return _filter_hours_old(pd.DataFrame.from_records(cached), hours_old), True
+
+    bucketed_kwargs = {**scrape_kwargs, "hours_old": _bucket_hours(hours_old)}
+    jobs_df = scrape_jobs(site_name=sites, **bucketed_kwargs)
+    if not jobs_df.empty:
+        _SEARCH_CACHE.set(key, jobs_df.to_dict(orient="records"))
+    return _filter_hours_old(jobs_df, hours_old), False
+
+
+def _scrape_sites_parallel(sites: list[str], scrape_kwargs: dict[str, Any]) -> tuple[pd.DataFrame, dict[str, dict]]:
+    """Scrape each job site in its own worker and stop waiting for a site once its deadline has passed.
+
+    At most JOB_SEARCH_MAX_WORKERS sites are scraped at once, and a site's deadline starts when it is submitted. Each
+    search has its own workers, so a scrape hung in a previous search never delays this one. Timed-out scrapes cannot
+    be interrupted and keep running in the background, their results are discarded, but they free their slot for the
+    next queued site.
+
+    Args:
+        sites (list[str]): Job sites to scrape, one worker per site.
+        scrape_kwargs (dict[str, Any]): Keyword arguments passed to `scrape_jobs` (without `site_name`).
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, dict]]: Concatenated jobs of the sites that completed in time and a status
+            block per site.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, len(sites)), thread_name_prefix="jobsearch")
+    queued = list(sites)
+    started: dict[Future, tuple[str, float]] = {}
+    frames: dict[str, pd.DataFrame] = {}
+    statuses: dict[str, dict] = {}
+
+    while queued or started:
+        while queued and len(started) < JOB_SEARCH_MAX_WORKERS:
+            site = queued.pop(0)
+            started[executor.submit(_scrape, [site], scrape_kwargs)] = (site, time.monotonic())
+
+        next_deadline = min(start for _, start in started.values()) + JOB_SEARCH_SITE_TIMEOUT
+        done, _ = wait(started, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+
+        now = time.monotonic()
+        for future in done:
+            site, start = started.pop(future)
+            elapsed = round(now - start, 2)
+            try:
+                frame, cached = future.result()
+            except Exception as e:
+                statuses[site] = {"status": "error", "jobs": 0, "elapsed_s": elapsed, "error": str(e)}
+                continue
+            frames[site] = frame
+            statuses[site] = {"status": "ok", "jobs": len(frame), "elapsed_s": elapsed, "cached": cached}
+
+        for future, (site, start) in list(started.items()):
+            if now >= start + JOB_SEARCH_SITE_TIMEOUT:
+                del started[future]
+                statuses[site] = {"status": "timeout", "jobs": 0, "elapsed_s": round(now - start, 2)}
+    executor.shutdown(wait=False)
+
+    ordered_frames = [frames[site] for site in sites if site in frames and not frames[site].empty]
+    jobs_df = pd.concat(ordered_frames, ignore_index=True) if ordered_frames else pd.DataFrame()
+    return jobs_df, {site: statuses[site] for site in sites}
+
+
+def _normalize_text(value: Any) -> str:  # noqa: ANN401
+    """Lowercase, strip accents and punctuation, and collapse whitespace.
+
+    Args:
+        value (Any): Value to normalize, missing values give an empty string.
+
+    Returns:
+        str: The normalized text.
+    """
+    if not isinstance(value, str):
+        return ""
+    text = unicodedata.normalize("NFKD", value.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def _job_key(job: pd.Series) -> tuple[str, str, str]:
+    """Build the exact duplicate key of a job from its normalized title, company and city.
+
+    Args:
+        job (pd.Series): A job row.
+
+    Returns:
+        tuple[str, str, str]: (title, company, city) keys.
+    """
+    title = job.get("title")
+    title = _GENDER_MARKER.sub(" ", title.lower()) if isinstance(title, str) else title
+    location = job.get("location")
+    city = location.split(",")[0] if isinstance(location, str) else location
+    return _normalize_text(title), _normalize_text(job.get("company")), _normalize_text(city)
+
+
+def _minhash(text: str) -> np.ndarray | None:
+    """Compute the MinHash signature of the word shingles of a text.
+
+    Args:
+        text (str): Normalized text.
+
+    Returns:
+        np.ndarray | None: Signature of JOB_DEDUP_NUM_PERM values, or None if the text is too short.
+    """
+    words = text.split()
+    shingles = {" ".join(words[i : i + JOB_DEDUP_SHINGLE_SIZE]) for i in range(len(words) - JOB_DEDUP_SHINGLE_SIZE + 1)}
+    if len(shingles) < JOB_DEDUP_MIN_SHINGLES:
+        return None
+    hashes = (
+        np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big") for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        % _MINHASH_PRIME
+    )
+    # Operands stay below 2**32 so the universal hashes (a * x + b) mod p cannot overflow 64 bits
+    permuted = (np.outer(_MINHASH_A, hashes) % _MINHASH_PRIME + _MINHASH_B[:, None]) % _MINHASH_PRIME
+    return permuted.min(axis=1)
+
+
+def _deduplicate_jobs(jobs_df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Collapse the same posting returned by several job sites into a single row.
+
+    Jobs are duplicates when their normalized title, company and city match and they come from different sites, share
+    a URL or have near-duplicate descriptions (MinHash with LSH banding on word shingles). Employers reuse the same
+    description template across cities and titles, so a description match alone never merges two jobs. Missing fields
+    of the kept row are filled from its duplicates, and the sites and URLs of every duplicate are listed under `sites`
+    and `source_urls`.
+
+    Args:
+        jobs_df (pd.DataFrame): Jobs returned by JobSpy.
+
+    Returns:
+        tuple[pd.DataFrame, int]: The deduplicated jobs and the number of collapsed rows.
+    """
+    if len(jobs_df) < 2:
+        return jobs_df, 0
+
+    jobs_df = jobs_df.reset_index(drop=True)
+    parents = list(range(len(jobs_df)))
+
+    def _find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    def _union(i: int, j: int) -> None:
+        root_i, root_j = _find(i), _find(j)
+        if root_i != root_j:
+            parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    keys = [_job_key(job) for _, job in jobs_df.iterrows()]
+    sites = jobs_df["site"].tolist() if "site" in jobs_df.columns else [None] * len(jobs_df)
+    urls = jobs_df["job_url"].tolist() if "job_url" in jobs_df.columns else [None] * len(jobs_df)
+    # A key match only merges rows of different sites, or rows sharing a URL: one board can list several openings
+    # with the same title, company and city. Same-site rows are left to the description check below.
+    clusters_by_key: dict[tuple[str, str, str], list[tuple[int, set, set]]] = {}
+    for i, key in enumerate(keys):
+        if not (key[0] and key[1]):
+            continue
+        site = sites[i] if isinstance(sites[i], str) else None
+        url = urls[i] if isinstance(urls[i], str) else None
+        clusters = clusters_by_key.setdefault(key, [])
+        for root, cluster_sites, cluster_urls in clusters:
+            if (url is not None and url in cluster_urls) or (site is not None and site not in cluster_sites):
+                _union(root, i)
+                break
+        else:
+            cluster_sites, cluster_urls = set(), set()
+            clusters.append((i, cluster_sites, cluster_urls))
+        if site is not None:
+            cluster_sites.add(site)
+        if url is not None:
+            cluster_urls.add(url)
+
+    if "description" in jobs_df.columns:
+        signatures = {}
+        for i, description in enumerate(jobs_df["description"]):
+            signature = _minhash(_normalize_text(description))
+            if signature is not None and keys[i][0] and keys[i][1]:
+                signatures[i] = signature
+        rows_per_band = max(1, JOB_DEDUP_NUM_PERM // JOB_DEDUP_BANDS)
+        buckets: dict[tuple, list[int]] = {}
+        for i, signature in signatures.items():
+            for band in range(0, JOB_DEDUP_NUM_PERM, rows_per_band):
+                buckets.setdefault((keys[i], band, signature[band : band + rows_per_band].tobytes()), []).append(i)
+        checked: set[tuple[int, int]] = set()
+        for candidates in buckets.values():
+            for pos, i in enumerate(candidates):
+                for j in candidates[pos + 1 :]:
+                    if (i, j) in checked or _find(i) == _find(j):
+                        continue
+                    checked.add((i, j))
+                    if float(np.mean(signatures[i] == signatures[j])) >= JOB_DEDUP_SIMILARITY:
+                        _union(i, j)
+
+    groups = pd.Series([_find(i) for i in range(len(jobs_df))], index=jobs_df.index)
+    collapsed = len(jobs_df) - groups.nunique()
+    if collapsed == 0:
+        return jobs_df, 0
+
+    grouped = jobs_df.groupby(groups, sort=True)
+    merged = grouped.first()
+    if "site" in jobs_df.columns:
+        merged["sites"] = grouped["site"].agg(lambda sites: list(dict.fromkeys(sites.dropna())))
+    if "job_url" in jobs_df.columns:
+        merged["source_urls"] = grouped["job_url"].agg(lambda urls: list(dict.fromkeys(urls.dropna())))
+    print(f"Deduplicated {collapsed} of {len(jobs_df)} jobs.")
+    return merged.reset_index(drop=True), collapsed
+
+
+def _compact_jobs(jobs_df: pd.DataFrame, fields: list[str] | None, max_description_chars: int | None) -> pd.DataFrame:
+    """Project the jobs on the requested fields, truncate descriptions and replace missing values with None.
+
+    Args:
+        jobs_df (pd.DataFrame): Jobs returned by JobSpy.
+        fields (list[str] | None): Columns to keep, unknown ones are ignored. None keeps every column.
+        max_description_chars (int | None): Maximum length of the description, None to keep it whole.
+
+    Returns:
+        pd.DataFrame: The compacted jobs.
+    """
+    if fields:
+        jobs_df = jobs_df[[field for field in fields if field in jobs_df.columns]]
+    if max_description_chars and "description" in jobs_df.columns:
+        jobs_df = jobs_df.assign(description=jobs_df["description"].str.slice(0, max_description_chars))
+    return jobs_df.astype(object).where(jobs_df.notna(), None)
+
+
+def _gzip_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Gzip a tool result when its JSON encoding exceeds JOB_SEARCH_GZIP_MIN_BYTES.
+
+    Args:
+        result (dict[str, Any]): The tool result.
+
+    Returns:
+        dict[str, Any]: The result unchanged, or `{"encoding": "gzip+base64", "data": ...}` wrapping its JSON.
+    """
+    payload = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+    if len(payload) < JOB_SEARCH_GZIP_MIN_BYTES:
+        return result
+    compressed = gzip.compress(payload, compresslevel=6)
+    print(f"Job search result compressed from {len(payload)} to {len(compressed)} bytes.")
+    return {"encoding": "gzip+base64", "data": base64.b64encode(compressed).decode("ascii")}
+
 
 def job_search_tool(
     site_name: list | str,
@@ -14,10 +380,18 @@ def job_search_tool(
     results_wanted: int,
     hours_old: int,
     linkedin_fetch_description: bool,
+    parallel_sites: bool = False,
+    deduplicate: bool = True,
+    fields: list[str] | None = None,
+    max_description_chars: int | None = None,
+    response_format: str = "records",
+    compress: bool = False,
     # country_indeed: str,
 ) -> dict:
     """Search for jobs using the scraper from JobSpy.
 
+    Identical searches are served from a local cache for a few minutes, with hours_old rounded up to the next day.
+
     Args:
         site_name (list | str): List of job sites to scrape from.
         search_term (str): The job title or keywords to search for.
@@ -29,26 +403,58 @@ def job_search_tool(
         results_wanted (int): The number of job listings to retrieve for each site.
         hours_old (int): The maximum age of job listings in hours (ZipRecruiter and Glassdoor round up to next days).
         linkedin_fetch_description (bool): Whether to fetch full description and direct job url for LinkedIn.
+        parallel_sites (bool): Whether to scrape each site in its own worker with a per-site timeout. Sites that
+            miss their deadline are skipped and reported in the `sites` status block.
+        deduplicate (bool): Whether to merge the same posting found on several sites into one job listing the
+            sites and URLs of its duplicates under `sites` and `source_urls`. The number of merged rows is
+            reported under `deduplicated`.
+        fields (list[str] | None): JobSpy columns to return (e.g. title, company, location, job_url, description).
+            All columns are returned when empty.
+        max_description_chars (int | None): Truncate job descriptions to this number of characters.
+        response_format (str): "records" for a list of job dicts, or "columnar" for
+            `{"columns": [...], "rows": [[...], ...]}` which does not repeat the keys for each job.
+        compress (bool): Whether to return large results as `{"encoding": "gzip+base64", "data": ...}`, the
+            base64 of the gzipped JSON result.
 
     Returns:
-        dict: A dict containing of the retrieved job informations.
+        dict: A dict containing the retrieved jobs under `jobs` and, in parallel mode, a status per site under `sites`.
     """
     distance_miles = int(distance * 0.621371)
+    sites = [site_name] if isinstance(site_name, str) else list(site_name)
 
-    jobs_df = scrape_jobs(
-        site_name=site_name,
-        search_term=search_term,
-        google_search_term=google_search_term,
-        location=location,
-        distance=distance_miles,
-        job_type=job_type,
-        is_remote=is_remote,
-        results_wanted=results_wanted,
-        hours_old=hours_old,
-        verbose=2,  # Set verbosity to 2 for detailed output
-        linkedin_fetch_description=linkedin_fetch_description,
-    )
+    scrape_kwargs = {
+        "search_term": search_term,
+        "google_search_term": google_search_term,
+        "location": location,
+        "distance": distance_miles,
+        "job_type": job_type,
+        "is_remote": is_remote,
+        "results_wanted": results_wanted,
+        "hours_old": hours_old,
+        "verbose": 2,  # Set verbosity to 2 for detailed output
+        "linkedin_fetch_description": linkedin_fetch_description,
+    }
+
+    site_statuses = None
+    if parallel_sites:
+        jobs_df, site_statuses = _scrape_sites_parallel(sites, scrape_kwargs)
+    else:
+        jobs_df, _ = _scrape(sites, scrape_kwargs)
 
-    jobs = jobs_df.to_dict(orient="records")
+    deduplicated = 0
+    if deduplicate:
+        jobs_df, deduplicated = _deduplicate_jobs(jobs_df)
 
-    return jobs
+    jobs_df = _compact_jobs(jobs_df, fields, max_description_chars)
+    if response_format == "columnar":
+        result: dict[str, Any] = {
+            "format": "columnar",
+            "jobs": {"columns": list(jobs_df.columns), "rows": jobs_df.values.tolist()},
+        }
+    else:
+        result = {"jobs": jobs_df.to_dict(orient="records")}
+    if deduplicate:
+        result["deduplicated"] = deduplicated
+    if site_statuses is not None:
+        result["sites"] = site_statuses
+    return _gzip_result(result) if compress else result
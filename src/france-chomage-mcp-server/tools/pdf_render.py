@@ -0,0 +1,106 @@
+"""Resume rasterization, run as a standalone script in a short-lived process by `resume_extractor`.
+
+The script reads the PDF bytes on stdin and writes the base64 encoded JPEG of each page as a JSON list on stdout. It
+only depends on pdf2image and Pillow, so the rendering process does not load the server and job search dependencies.
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+from io import BytesIO
+
+from pdf2image import convert_from_bytes, pdfinfo_from_bytes
+from PIL import Image
+
+# Rendering profile of the image sent to the VLM
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "3"))
+RESUME_RENDER_DPI = int(os.getenv("RESUME_RENDER_DPI", "150"))
+RESUME_RENDER_GRAYSCALE = os.getenv("RESUME_RENDER_GRAYSCALE", "true").lower() in {"1", "true", "yes"}
+RESUME_MAX_LONG_EDGE = int(os.getenv("RESUME_MAX_LONG_EDGE", "1600"))  # in pixels, 0 disables resizing
+RESUME_MAX_IMAGE_BYTES = int(os.getenv("RESUME_MAX_IMAGE_BYTES", "350000"))  # JPEG byte budget per page
+RESUME_JPEG_QUALITIES = (85, 75, 65, 55, 45, 35)
+# Address space ceiling of the render process, inherited by the single pdftoppm process rendering the current page
+RESUME_RENDER_MAX_MEMORY_MB = int(os.getenv("RESUME_RENDER_MAX_MEMORY_MB", "1536"))  # 0 for no limit
+RESUME_RENDER_TIMEOUT = float(os.getenv("RESUME_RENDER_TIMEOUT", "60"))  # in seconds
+
+
+def _limit_memory(max_memory_mb: int) -> None:
+    """Cap the address space of the rendering process and of the pdftoppm processes it spawns (Unix only).
+
+    Args:
+        max_memory_mb (int): Memory ceiling in megabytes, 0 for no limit.
+    """
+    if max_memory_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _encode_jpeg(image: Image.Image) -> bytes:
+    """Encode a page image as JPEG, downscaled to the max long edge and with the best quality fitting the byte budget.
+
+    Args:
+        image (Image.Image): Rendered page image.
+
+    Returns:
+        bytes: JPEG bytes, at the lowest quality if even that does not fit the budget.
+    """
+    if RESUME_MAX_LONG_EDGE > 0 and max(image.size) > RESUME_MAX_LONG_EDGE:
+        image.thumbnail((RESUME_MAX_LONG_EDGE, RESUME_MAX_LONG_EDGE), Image.Resampling.LANCZOS)
+
+    for quality in RESUME_JPEG_QUALITIES:
+        buffered = BytesIO()
+        image.save(buffered, format="JPEG", quality=quality, optimize=True)
+        if buffered.tell() <= RESUME_MAX_IMAGE_BYTES:
+            break
+
+    print(
+        f"Resume page encoded: {image.size[0]}x{image.size[1]}px, quality {quality}, {buffered.tell()} bytes.",
+        file=sys.stderr,
+    )
+    return buffered.getvalue()
+
+
+def pdf_to_base64(pdf_bytes: bytes) -> list[str]:
+    """Convert the first RESUME_MAX_PAGES pages of a PDF to base64 encoded JPEGs using the rendering profile.
+
+    Pages are rendered one at a time, each by a single pdftoppm process, so the memory ceiling of the render process
+    also bounds pdftoppm. pdftoppm is killed once the whole render exceeds RESUME_RENDER_TIMEOUT.
+
+    Args:
+        pdf_bytes (bytes): Raw PDF content.
+
+    Returns:
+        list[str]: Base64 encoded string of each page image.
+
+    Raises:
+        ValueError: If the PDF cannot be converted to images.
+    """
+    deadline = time.monotonic() + RESUME_RENDER_TIMEOUT
+    page_count = pdfinfo_from_bytes(pdf_bytes, timeout=int(RESUME_RENDER_TIMEOUT)).get("Pages", 0)
+    pages_base64 = []
+    for page in range(1, min(page_count, RESUME_MAX_PAGES) + 1):
+        images = convert_from_bytes(
+            pdf_bytes,
+            dpi=RESUME_RENDER_DPI,
+            grayscale=RESUME_RENDER_GRAYSCALE,
+            first_page=page,
+            last_page=page,
+            timeout=max(1, round(deadline - time.monotonic())),
+        )
+        pages_base64.extend(base64.b64encode(_encode_jpeg(image)).decode("utf-8") for image in images)
+    if not pages_base64:
+        raise ValueError("Could not convert PDF bytes to image.")
+
+    return pages_base64
+
+
+if __name__ == "__main__":
+    _limit_memory(RESUME_RENDER_MAX_MEMORY_MB)
+    json.dump(pdf_to_base64(sys.stdin.buffer.read()), sys.stdout)
@@ -1,14 +1,60 @@
 """MCP tool for Resume Extraction using a VLM."""
 
 import base64
+import hashlib
 import json
 import os
-from io import BytesIO
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 
-from openai import OpenAI
-from pdf2image import convert_from_bytes, convert_from_path
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 from pydantic import BaseModel, Field
 
+from . import pdf_render
+from .cache import SQLiteCache
+from .pdf_render import RESUME_MAX_PAGES, RESUME_RENDER_TIMEOUT
+
+NEBIUS_BASE_URL = "https://api.tokenfactory.nebius.com/v1"
+NEBIUS_MAX_CONNECTIONS = int(os.getenv("NEBIUS_MAX_CONNECTIONS", "20"))
+NEBIUS_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("NEBIUS_MAX_KEEPALIVE_CONNECTIONS", "10"))
+NEBIUS_KEEPALIVE_EXPIRY = float(os.getenv("NEBIUS_KEEPALIVE_EXPIRY", "60"))  # in seconds
+NEBIUS_TIMEOUT = float(os.getenv("NEBIUS_TIMEOUT", "120"))  # in seconds
+NEBIUS_CONNECT_TIMEOUT = float(os.getenv("NEBIUS_CONNECT_TIMEOUT", "10"))  # in seconds
+
+RESUME_MODEL = "nvidia/Nemotron-Nano-V2-12b"
+# Bump when ResumeData or the extraction prompt changes to invalidate cached extractions
+RESUME_SCHEMA_VERSION = "4"
+RESUME_CACHE_MAX_BYTES = int(os.getenv("RESUME_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))  # 0 disables the cache
+
+# Rasterization runs in short-lived processes, at most RESUME_RENDER_WORKERS at a time, so large or concurrent resumes
+# cannot starve the server. The rendering profile, memory ceiling and timeout are read by `pdf_render`.
+RESUME_RENDER_WORKERS = int(os.getenv("RESUME_RENDER_WORKERS", "2"))
+RESUME_RENDER_QUEUE_TIMEOUT = float(os.getenv("RESUME_RENDER_QUEUE_TIMEOUT", "120"))  # in seconds
+RESUME_RENDER_KILL_GRACE = 5  # in seconds, left to pdftoppm's own timeout before the render process is killed
+
+# Text-layer fast path: born-digital PDFs are sent as text instead of an image
+RESUME_TEXT_FAST_PATH = os.getenv("RESUME_TEXT_FAST_PATH", "true").lower() in {"1", "true", "yes"}
+RESUME_TEXT_MIN_CHARS = int(os.getenv("RESUME_TEXT_MIN_CHARS", "300"))
+
+_RESUME_CACHE = (
+    SQLiteCache("resume_extractor", max_bytes=RESUME_CACHE_MAX_BYTES) if RESUME_CACHE_MAX_BYTES > 0 else None
+)
+
+_VLM_CLIENT: OpenAI | None = None
+_VLM_CLIENT_LOCK = threading.Lock()
+
+_RENDER_QUEUE_LOCK = threading.Lock()
+_RENDER_SLOTS = threading.BoundedSemaphore(RESUME_RENDER_WORKERS)
+_render_queue_depth = 0
+
 
 class Experience(BaseModel):
     """Model for a single professional experience entry."""
@@ -36,26 +82,216 @@ class ResumeData(BaseModel):
     others: list[str] = Field(..., description="Other relevant information")
 
 
-def _pdf_to_base64(pdf_path: str) -> str:
-    """Convert PDF file to base64 encoded string.
+def _vlm_client() -> OpenAI:
+    """Return the process-wide Nebius client, creating it on first use.
+
+    The client keeps its connections alive between calls and is safe to share between threads.
+
+    Returns:
+        OpenAI: The shared Nebius OpenAI-compatible client.
+    """
+    global _VLM_CLIENT
+    if _VLM_CLIENT is None:
+        with _VLM_CLIENT_LOCK:
+            if _VLM_CLIENT is None:
+                http_client = DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=NEBIUS_MAX_CONNECTIONS,
+                        max_keepalive_connections=NEBIUS_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=NEBIUS_KEEPALIVE_EXPIRY,
+                    ),
+                )
+                _VLM_CLIENT = OpenAI(
+                    base_url=NEBIUS_BASE_URL,
+                    api_key=os.environ.get("NEBIUS_API_KEY"),
+                    timeout=httpx.Timeout(NEBIUS_TIMEOUT, connect=NEBIUS_CONNECT_TIMEOUT),
+                    http_client=http_client,
+                )
+    return _VLM_CLIENT
+
+
+def _read_pdf_bytes(resume_file: str) -> bytes:
+    """Read the PDF content from a file path or a base64 data URI.
+
+    Args:
+        resume_file (str): Path to the resume file (PDF format) or base64 data URI.
+
+    Returns:
+        bytes: Raw PDF content.
+
+    Raises:
+        ValueError: If the PDF content cannot be read.
+    """
+    if resume_file.startswith("data:application/pdf;base64,"):
+        base64_data = resume_file.split(",", 1)[1]
+        try:
+            return base64.b64decode(base64_data)
+        except ValueError as e:
+            raise ValueError(f"Invalid base64 PDF data: {e}") from e
+
+    try:
+        with open(resume_file, "rb") as f:
+            return f.read()
+    except OSError as e:
+        msg = f"Could not read PDF file: {resume_file}"
+        raise ValueError(msg) from e
+
+
+def _resume_cache_key(pdf_bytes: bytes) -> str:
+    """Build the cache key of a resume from its content, the VLM and the ResumeData schema version.
+
+    Args:
+        pdf_bytes (bytes): Raw PDF content.
+
+    Returns:
+        str: SHA-256 hex digest identifying the extraction.
+    """
+    pdf_digest = hashlib.sha256(pdf_bytes).hexdigest()
+    return hashlib.sha256(f"{RESUME_MODEL}|{RESUME_SCHEMA_VERSION}|{pdf_digest}".encode()).hexdigest()
+
+
+def _pdf_to_text(pdf_bytes: bytes) -> str:
+    """Extract the text layer of the first RESUME_MAX_PAGES pages with poppler's pdftotext.
+
+    Args:
+        pdf_bytes (bytes): Raw PDF content.
+
+    Returns:
+        str: Extracted text, empty if pdftotext is unavailable, fails or the PDF has no text layer.
+    """
+    pdftotext = shutil.which("pdftotext")
+    if pdftotext is None:
+        return ""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = Path(tmp_dir) / "resume.pdf"
+        pdf_path.write_bytes(pdf_bytes)
+        try:
+            completed = subprocess.run(  # noqa: S603
+                [pdftotext, "-layout", "-enc", "UTF-8", "-f", "1", "-l", str(RESUME_MAX_PAGES), str(pdf_path), "-"],
+                capture_output=True,
+                timeout=30,
+                check=True,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            print(f"pdftotext failed, falling back to rasterization: {e}")
+            return ""
+
+    return completed.stdout.decode("utf-8", errors="ignore").strip()
+
+
+def _kill_render_process(process: subprocess.Popen) -> None:
+    """Kill a render process together with the pdftoppm processes it started.
+
+    Args:
+        process (subprocess.Popen): The render process, started in its own session.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        process.kill()
+    process.communicate()
+
+
+def render_queue_depth() -> int:
+    """Return the number of resumes waiting for a rasterization slot.
+
+    Returns:
+        int: Current rasterization queue depth.
+    """
+    return _render_queue_depth
+
+
+def _rasterize(pdf_bytes: bytes) -> list[str]:
+    """Rasterize a PDF in a separate process, at most RESUME_RENDER_WORKERS at a time.
+
+    The process is killed with its pdftoppm children when it outlives RESUME_RENDER_TIMEOUT, so a hung render never
+    keeps its slot.
 
     Args:
-        pdf_path (str): Path to the PDF file.
+        pdf_bytes (bytes): Raw PDF content.
 
     Returns:
-        str: Base64 encoded string of the PDF file.
+        list[str]: Base64 encoded string of each page image.
 
     Raises:
-        ValueError: If the PDF file cannot be read.
+        ValueError: If no slot frees up in time, or the rasterization fails, times out or exceeds its memory ceiling.
     """
-    image = convert_from_path(pdf_path, first_page=1, last_page=1)
-    if not image:
-        msg = f"Could not convert PDF to image: {pdf_path}"
-        raise ValueError(msg)
+    global _render_queue_depth
+    acquired = _RENDER_SLOTS.acquire(blocking=False)
+    if not acquired:
+        with _RENDER_QUEUE_LOCK:
+            _render_queue_depth += 1
+            print(f"Resume rasterization queued, queue depth {_render_queue_depth}.")
+        acquired = _RENDER_SLOTS.acquire(timeout=RESUME_RENDER_QUEUE_TIMEOUT)
+        with _RENDER_QUEUE_LOCK:
+            _render_queue_depth -= 1
+    if not acquired:
+        raise ValueError("Rasterization queue is full, please retry later.")
+
+    try:
+        # Run by path so the process does not import the tools package and its job search dependencies
+        process = subprocess.Popen(  # noqa: S603
+            [sys.executable, pdf_render.__file__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = process.communicate(pdf_bytes, timeout=RESUME_RENDER_TIMEOUT + RESUME_RENDER_KILL_GRACE)
+        except subprocess.TimeoutExpired as e:
+            _kill_render_process(process)
+            raise ValueError(f"Rasterization took more than {RESUME_RENDER_TIMEOUT:.0f}s.") from e
+
+        logs = stderr.decode("utf-8", errors="ignore").strip()
+        if process.returncode != 0:
+            last_line = logs.splitlines()[-1] if logs else f"exit code {process.returncode}"
+            raise ValueError(f"Rasterization failed, the PDF may be invalid or exceed the memory limit: {last_line}")
+        if logs:
+            print(logs)
+        return json.loads(stdout)
+    finally:
+        _RENDER_SLOTS.release()
 
-    buffered = BytesIO()
-    image[0].save(buffered, format="JPEG", quality=90)
-    return base64.b64encode(buffered.getvalue()).decode("utf-8")
+
+def _merge_resume_data(fragments: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge the ResumeData extracted from each page, de-duplicating list entries.
+
+    Scalar fields take the first non-empty value. Experiences and education are de-duplicated on organization, role
+    and start date, other lists on their case-folded text.
+
+    Args:
+        fragments (list[dict[str, Any]]): ResumeData dicts extracted page by page, in page order.
+
+    Returns:
+        dict[str, Any]: Merged ResumeData dict.
+    """
+
+    def _entry_key(entry: Any) -> Any:  # noqa: ANN401
+        if isinstance(entry, dict):
+            return tuple(
+                " ".join(str(entry.get(k) or "").casefold().split()) for k in ("organization", "role", "start_date")
+            )
+        return " ".join(str(entry).casefold().split())
+
+    merged: dict[str, Any] = {}
+    for field in ResumeData.model_fields:
+        values = [fragment.get(field) for fragment in fragments if fragment.get(field)]
+        if not values:
+            merged[field] = None
+        elif not isinstance(values[0], list):
+            merged[field] = values[0]
+        else:
+            seen: set = set()
+            entries = []
+            for entry in (e for value in values if isinstance(value, list) for e in value):
+                key = _entry_key(entry)
+                if key not in seen:
+                    seen.add(key)
+                    entries.append(entry)
+            merged[field] = entries
+    return merged
 
 
 def resume_extractor(resume_file: str) -> dict:
@@ -81,6 +317,10 @@ def resume_extractor(resume_file: str) -> dict:
     - end_date (str): End date of the experience or 'Present' if ongoing.
     - description (str): Brief description of the experience.
 
+    Extractions are cached on the PDF content, so re-uploading the same resume skips the VLM call. PDFs with a text
+    layer are sent to the model as text, scanned PDFs are rasterized and their pages (up to RESUME_MAX_PAGES) are
+    extracted concurrently then merged.
+
     Args:
         resume_file (str): Path to the resume file (PDF format) or  base64 data URI.
 
@@ -88,28 +328,41 @@ def resume_extractor(resume_file: str) -> dict:
         dict: Extracted information from the resume in JSON format based on ResumeData model.
     """
     try:
-        if resume_file.startswith("data:application/pdf;base64,"):
-            base64_data = resume_file.split(",", 1)[1]
-            pdf_bytes = base64.b64decode(base64_data)
-            image = convert_from_bytes(pdf_bytes, first_page=1, last_page=1)
-
-            if not image:
-                raise ValueError("Could not convert PDF bytes to image.")
-
-            buffered = BytesIO()
-            image[0].save(buffered, format="JPEG", quality=90)
-            resume_base64 = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-        else:
-            resume_base64 = _pdf_to_base64(resume_file)
+        pdf_bytes = _read_pdf_bytes(resume_file)
     except ValueError as e:
         return {"error": f"Failed to process resume file: {e}"}
 
-    client = OpenAI(base_url="https://api.tokenfactory.nebius.com/v1", api_key=os.environ.get("NEBIUS_API_KEY"))
+    cache_key = _resume_cache_key(pdf_bytes)
+    if _RESUME_CACHE is not None:
+        cached = _RESUME_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+    resume_text = _pdf_to_text(pdf_bytes) if RESUME_TEXT_FAST_PATH else ""
+    # -layout pads columns with spaces, so only visible characters count towards the threshold
+    text_chars = sum(not char.isspace() for char in resume_text)
+    if text_chars >= RESUME_TEXT_MIN_CHARS:
+        print(f"Resume text layer found ({text_chars} chars), skipping rasterization.")
+        requests = [[{"type": "text", "text": f"Extract resume data to JSON.\n\nResume text:\n{resume_text}"}]]
+    else:
+        try:
+            pages_base64 = _rasterize(pdf_bytes)
+        except ValueError as e:
+            return {"error": f"Failed to process resume file: {e}"}
+        requests = [
+            [
+                {"type": "text", "text": f"Extract resume data to JSON (page {page} of {len(pages_base64)})."},
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{page_base64}"}},
+            ]
+            for page, page_base64 in enumerate(pages_base64, start=1)
+        ]
+
+    client = _vlm_client()
 
     system_prompt = f"""
     You are an expert resume analyzer.
-    Extract only the relevant information from the resume image into a strict JSON format.
+    Extract only the relevant information from the resume (image or text) into a strict JSON format.
+    The resume may be split in several pages, only extract what is present in the provided content.
     Explications of the fields to extract:
     {json.dumps(ResumeData.model_json_schema(), indent=2)}
 
@@ -119,27 +372,31 @@ def resume_extractor(resume_file: str) -> dict:
     3. Normalize dates to YYYY-MM format if possible.
     """
 
-    try:
+    def _extract(user_content: list[dict[str, Any]]) -> dict[str, Any]:
         response = client.chat.completions.parse(
-            model="nvidia/Nemotron-Nano-V2-12b",
+            model=RESUME_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": "Extract resume data to JSON."},
-                        {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{resume_base64}"}},
-                    ],
-                },
+                {"role": "user", "content": user_content},
             ],
             response_format=ResumeData,
             temperature=0.1,
         )
+        return json.loads(response.choices[0].message.content)
 
-        data = response.choices[0].message.content
-        resume_data = json.loads(data)
+    fragments: list[dict[str, Any]] = []
+    errors: list[str] = []
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        for future in [executor.submit(_extract, user_content) for user_content in requests]:
+            try:
+                fragments.append(future.result())
+            except (json.JSONDecodeError, KeyError, IndexError, AttributeError, ValueError) as e:
+                errors.append(str(e))
 
-    except (json.JSONDecodeError, KeyError, IndexError, AttributeError, ValueError) as e:
-        return {"error": f"VLM request failed: {e}"}
-    else:
-        return resume_data
+    if not fragments:
+        return {"error": f"VLM request failed: {'; '.join(errors)}"}
+
+    resume_data = fragments[0] if len(fragments) == 1 else _merge_resume_data(fragments)
+    if _RESUME_CACHE is not None and not errors:
+        _RESUME_CACHE.set(cache_key, resume_data)
+    return resume_data